@@ -7,18 +7,519 @@ folder support, multi-PDF navigation, and crop preview panel
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import PyPDF2
 import os
 import zipfile
+import shutil
 import io
 from PIL import Image, ImageTk
 import pymupdf as fitz  # Updated import for PyMuPDF 1.26.3
 from pathlib import Path
 import threading
+import contextlib
 from typing import List, Tuple, Optional
 import math
 import glob
 import time
+import hashlib
+import json
+import bisect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque, OrderedDict
+
+# Documents opened inside a render-pool worker process: {(path, mtime): fitz.Document}
+_worker_documents = {}
+_WORKER_MAX_DOCUMENTS = 4
+
+# Exported PNG crops are rendered at 2x zoom for better quality
+_CROP_EXPORT_MATRIX = fitz.Matrix(2.0, 2.0)
+
+
+def _thumbnail_zoom(page_rect, size):
+    """Return the zoom that fits a page's longest side to size pixels"""
+    return size / max(page_rect.width, page_rect.height)
+
+
+def _warm_up_worker():
+    """No-op task that makes a render-pool worker finish starting up"""
+    return os.getpid()
+
+
+def _render_page(pdf_path, page_index, size):
+    """Rasterise one page in a render-pool worker and return it as PPM bytes
+
+    PyMuPDF holds the GIL while rendering and Document objects cannot be shared
+    across processes, so each worker opens the file itself and keeps it open for
+    the following pages.
+    """
+    page = _worker_document(pdf_path)[page_index]
+    zoom = _thumbnail_zoom(page.rect, size)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    return pix.tobytes("ppm")
+
+
+def _crop_zoom(crop_rect):
+    """Return the zoom that renders a crop region at most 120x120 pixels (at most 1.5x)"""
+    return min(1.5, 120 / max(crop_rect.width, crop_rect.height, 1))
+
+
+def _render_crop(pdf_path, page_index, clip):
+    """Rasterise a crop region preview in a render-pool worker and return it as PPM bytes"""
+    page = _worker_document(pdf_path)[page_index]
+    crop_rect = fitz.Rect(clip)
+    zoom = _crop_zoom(crop_rect)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=crop_rect, alpha=False)
+    return pix.tobytes("ppm")
+
+
+def _worker_document(pdf_path):
+    """Return this worker's open document for a PDF, reopening it if the file changed"""
+    key = (pdf_path, os.path.getmtime(pdf_path))
+    doc = _worker_documents.get(key)
+    if doc is None:
+        if len(_worker_documents) >= _WORKER_MAX_DOCUMENTS:
+            for old_doc in _worker_documents.values():
+                old_doc.close()
+            _worker_documents.clear()
+        doc = fitz.open(pdf_path)
+        _worker_documents[key] = doc
+    return doc
+
+
+def _copy_page_range(source_doc, start_page, end_page, rotations):
+    """Copy pages start_page..end_page (0-based) into a new PDF and return its bytes
+
+    rotations maps offsets within the range to extra clockwise rotations in degrees.
+    """
+    # Copy the page range by reference - content streams are not re-parsed
+    range_doc = fitz.open()
+    range_doc.insert_pdf(source_doc, from_page=start_page, to_page=end_page)
+    for offset, rotation_angle in rotations.items():
+        page = range_doc[offset]
+        page.set_rotation((page.rotation + rotation_angle) % 360)
+    pdf_data = range_doc.tobytes(garbage=4, deflate=True)
+    range_doc.close()
+    return pdf_data
+
+
+def _build_range_pdf(pdf_path, start_page, end_page, rotations):
+    """Build one split range in a render-pool worker (see _copy_page_range)"""
+    return _copy_page_range(_worker_document(pdf_path), start_page, end_page, rotations)
+
+
+def _save_crop_pdf(source_doc, page_index, clip, save_path):
+    """Save a crop region of a page as a one-page PDF"""
+    # Copy the page, then crop the copy so the source stays untouched
+    crop_doc = fitz.open()
+    crop_doc.insert_pdf(source_doc, from_page=page_index, to_page=page_index)
+    crop_doc[0].set_cropbox(fitz.Rect(clip))
+    crop_doc.save(save_path)
+    crop_doc.close()
+
+
+def _extract_crop_pdf(pdf_path, page_index, clip, save_path):
+    """Save one crop as a PDF in a render-pool worker (see _save_crop_pdf)"""
+    _save_crop_pdf(_worker_document(pdf_path), page_index, clip, save_path)
+
+
+def _save_crop_png(source_doc, page_index, clip, save_path):
+    """Render a crop region of a page at _CROP_EXPORT_MATRIX and save it as a PNG"""
+    pix = source_doc[page_index].get_pixmap(matrix=_CROP_EXPORT_MATRIX, clip=fitz.Rect(clip))
+    pix.save(save_path)
+
+
+def _extract_crop_png(pdf_path, page_index, clip, save_path):
+    """Save one crop as a PNG in a render-pool worker (see _save_crop_png)"""
+    _save_crop_png(_worker_document(pdf_path), page_index, clip, save_path)
+
+
+# Text shown by the Help and About dialogs
+HELP_TEXT = """Homemade PDF Editor - How to Use
+
+🚀 QUICK START:
+1. Click "Select PDF File" or "Select Folder" to load documents
+2. Wait for page thumbnails to appear
+3. Select pages for splitting OR use crop mode for area extraction OR edit pages
+4. Click "Split & Save ZIP", extract crops, or save edited PDF
+
+📁 FOLDER MODE:
+• Select a folder containing multiple PDF files
+• Use ⬅️➡️ keys to navigate between PDFs
+• Use ⬆️⬇️ keys to scroll through pages
+• Select ranges from any PDF in the folder
+
+✏️ EDIT MODE:
+• Toggle "✏️ Edit Mode" to enable comprehensive page editing
+• Drag any page thumbnail to rearrange pages
+• Click ❌ button on pages to delete them
+• Use ↺↻ rotation buttons to rotate pages (only available in edit mode)
+• Drop between pages to insert at that position
+• Blue highlighting shows valid drop zones during drag
+• Page numbers show current position (e.g., "#1: Page 5" means Page 5 is now in position 1)
+• Deleted pages are removed from the document entirely
+• Click "Reset" to restore original order, deleted pages, and rotations
+• Click "Save PDF" to save all edits (reorder, deletions, rotations) as a new PDF file
+• Edit mode consolidates all page modification operations
+
+✂️ CROP MODE:
+• Toggle crop mode with "✂️ Crop Mode" checkbox
+• Drag on page thumbnails to select rectangular areas
+• Multiple crops per page supported
+• Extract crops as PDF files (vector quality) or PNG images (raster)
+• Automatic filename generation with page and crop numbers
+• Preview crops in the right panel with individual delete buttons
+
+📖 PAGE SELECTION:
+• First click: Sets START of range (green)
+• Second click: Sets END of range (red) 
+• Pages between: Automatically selected (yellow)
+• Same page twice: Single page selection
+• Individual ❌ buttons: Click to delete specific ranges
+
+🎯 OPERATION EXAMPLES:
+• Pages 1-10: Click page 1, then click page 10
+• Single page 5: Click page 5, then click page 5 again
+• Multiple ranges: Complete one range, then start another
+• Delete specific range: Click ❌ button next to the range
+• Crop areas: Enable crop mode, drag on thumbnails to select regions
+• Reorder pages: Enable edit mode, drag pages to new positions
+• Delete pages: Enable edit mode, click ❌ on pages to remove them
+• Rotate pages: Enable edit mode, use ↺↻ buttons
+
+🛠️ CONTROLS:
+• Thumbnail Size: Use slider, +/- buttons, or Ctrl+Mouse Wheel (up to 1600px!)
+• Automatic View Switching: Grid view under 500px, Single view at 500px+
+• Mouse wheel: Scroll through pages
+• Ctrl+Mouse wheel: Zoom in/out (like web browsers)
+• Clear Ranges: Remove page ranges (in Selected Ranges panel)
+• Clear Crops: Remove crop rectangles (in Crop Previews panel)
+• Reset: Restore original order, deleted pages, and rotations (edit mode)
+• Individual Delete: Click ❌ buttons next to ranges/crops to remove specific items
+
+⌨️ KEYBOARD SHORTCUTS:
+• Ctrl+O: Open PDF file
+• Ctrl+Shift+O: Open folder
+• Ctrl+C: Clear all selections
+• Ctrl+R: Reset edit session (restore all changes)
+• Ctrl+S: Save edited PDF
+• Ctrl+T: Toggle crop mode
+• Ctrl+E: Toggle edit mode
+• Ctrl+P: Extract crops as PDF
+• Ctrl+G: Extract crops as PNG
+• Ctrl++/Ctrl+-: Zoom in/out
+• Ctrl+Mouse Wheel: Zoom in/out (like web browsers)
+• Ctrl+0: Reset zoom
+• ⬆️⬇️: Navigate between PDFs (folder mode)
+• ⬅️➡️: Scroll through pages
+• F1: Show this help
+
+🎨 VISUAL INDICATORS:
+🟢 Green border + "START": Beginning of range
+🔴 Red border + "END": End of range
+🟡 Yellow border + "SELECTED": Pages in range
+🔵 Blue hover: Page you're about to click
+🟠 Orange: Page being dragged (edit mode)
+🔵 Blue highlight: Valid drop zone (edit mode)
+🟣 Lavender background: Edit mode active
+✂️ Crosshair cursor: Crop mode active
+✏️ Position numbers: Current page order (e.g., "#2: Page 7")
+❌ Delete buttons: Remove pages or crops
+↺↻ Rotation buttons: Only visible in edit mode
+
+📦 OUTPUT OPTIONS:
+• Split PDFs: Creates ZIP with separate PDFs for each range
+• Crop PDFs: Creates individual PDF files for each crop area
+• Crop PNGs: Creates PNG images for each crop area
+• Edited PDF: Saves current page order with deletions and rotations applied
+• Automatic filename generation with source info
+• Preserves original PDF quality and applies all edits
+
+💡 TIPS:
+• Zoom automatically switches view modes (Grid < 500px, Single ≥ 500px)
+• Larger thumbnails help identify pages and make editing/cropping easier
+• You can select overlapping ranges
+• Crop mode works best with zoomed-in thumbnails
+• Edit mode consolidates all page editing in one place
+• Right panel shows selected ranges and crop previews with more space
+• Click ❌ buttons for quick individual removal of ranges/crops/pages
+• Navigation buttons appear when multiple PDFs loaded
+• Edit changes are preserved when switching between crop/selection modes
+• Page rotations only work in edit mode for consistency
+• Deleted pages are completely removed from the final document
+
+⚠️ IMPORTANT NOTES:
+• Only one mode can be active at a time (Selection, Crop, or Edit)
+• Editing only affects the current PDF (not folder-wide)
+• Original PDF is never modified - all operations create new files
+• Edited pages maintain their formatting
+• Page numbers in edit view show both position and original page
+• Deleted pages cannot be recovered except by clicking "Reset"
+• Rotation buttons only appear in edit mode
+
+⚠️ REQUIREMENTS:
+• PDF files only (no password protection)
+• Minimum 16MB free disk space
+• At least one page range, crop area, or edit operation must be performed"""
+
+ABOUT_TEXT = """Homemade PDF Editor v5.1
+
+A powerful desktop application for splitting PDF files with visual page selection, thumbnail previews, comprehensive edit mode (drag & drop reordering + page deletion + rotation), multi-PDF folder support, and crop extraction functionality with enhanced visual feedback, browser-like zoom controls, and streamlined interface.
+
+🔧 FEATURES:
+• Visual page thumbnails for easy identification
+• Click-to-select page ranges
+• Comprehensive Edit Mode with drag & drop page reordering, deletion, and rotation
+• Multiple range selection support
+• Individual ❌ delete buttons for ranges, crops, and pages
+• Contextual clear and reset functions
+• Visual crop selection feedback with transparent overlay
+• Browser-like zoom controls (Ctrl+Mouse Wheel)
+• Clean, streamlined control interface with intelligent mode switching
+• Folder-based PDF loading with navigation
+• PDF navigation with arrow keys
+• Adjustable thumbnail zoom (up to 1600px)
+• Automatic view mode switching based on zoom level
+• Crop mode for area extraction with real-time visual feedback
+• Extract crops as PDF or PNG files
+• Enhanced crop preview panel with more space
+• ZIP file output with multiple PDFs
+• Save edited PDFs with all modifications applied
+• Modern, intuitive interface with visual mode indicators
+• Enhanced keyboard shortcuts
+• Progress tracking and status updates
+
+💻 TECHNICAL INFO:
+• Built with Python and tkinter
+• Uses PyMuPDF for PDF rendering, cropping, reordering, and deletion
+• Advanced drag & drop implementation with ghost images
+• Comprehensive edit session management
+• Cross-platform compatibility
+• No internet connection required
+
+👨‍💻 DEVELOPED BY:
+Enhanced by Claude (Anthropic) with Comprehensive Edit Mode - December 2024
+
+🆓 LICENSE:
+Free for personal and commercial use
+
+📧 SUPPORT:
+For issues or questions, please refer to the documentation or contact support."""
+
+
+class ThumbnailCache:
+    """Persistent on-disk JPEG cache for rendered page thumbnails
+
+    Thumbnails are stored as <cache_dir>/<sha1(path)>/<page>_<size>.jpg next to a
+    meta.json sidecar holding the source file's mtime, byte size and page count.
+    Crop previews live alongside them as <page>_crop_<sha1(rect)>.png.
+    A sidecar mismatch invalidates the whole document directory. Files are touched
+    on every hit so eviction can drop the least recently used thumbnails first.
+    """
+
+    META_FILENAME = 'meta.json'
+    JPEG_QUALITY = 90
+
+    def __init__(self, cache_dir=None, max_bytes=500 * 1024 * 1024):
+        if cache_dir is None:
+            cache_dir = Path.home() / '.homemade_pdf_editor' / 'trn_DocumentPreviewCache'
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.evict_lock = threading.Lock()  # Held by the one eviction pass allowed at a time
+        self.validated = {}  # {doc_dir: (source signature, {page_idx: set(sizes)})} checked this session
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.enabled = True
+        except OSError:
+            self.enabled = False
+
+    def _doc_dir(self, pdf_path):
+        """Return the cache directory for a PDF file"""
+        digest = hashlib.sha1(os.path.abspath(pdf_path).encode('utf-8')).hexdigest()
+        return self.cache_dir / digest
+
+    def _source_signature(self, pdf_path, page_count):
+        """Describe the source file so stale cache entries can be detected"""
+        stat = os.stat(pdf_path)
+        return {'mtime': stat.st_mtime, 'size': stat.st_size, 'page_count': page_count}
+
+    def _load_index(self, pdf_path, page_count):
+        """Validate the document directory against the source file and index its contents"""
+        doc_dir = self._doc_dir(pdf_path)
+        # The source can change while the app runs, so it is re-checked on every call
+        signature = self._source_signature(pdf_path, page_count)
+        validated = self.validated.get(doc_dir)
+        if validated is not None and validated[0] == signature:
+            return doc_dir, validated[1]
+
+        meta_path = doc_dir / self.META_FILENAME
+        index = {}
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                cached_signature = json.load(meta_file)
+        except (OSError, ValueError):
+            cached_signature = None
+
+        if cached_signature == signature:
+            for entry in os.scandir(doc_dir):
+                name, ext = os.path.splitext(entry.name)
+                if ext != '.jpg':
+                    continue
+                try:
+                    page_idx, size = (int(part) for part in name.split('_'))
+                except ValueError:
+                    continue
+                index.setdefault(page_idx, set()).add(size)
+        else:
+            # Source changed (or first visit) - start this document over
+            if doc_dir.exists():
+                for entry in os.scandir(doc_dir):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+            doc_dir.mkdir(parents=True, exist_ok=True)
+            with open(meta_path, 'w', encoding='utf-8') as meta_file:
+                json.dump(signature, meta_file)
+
+        self.validated[doc_dir] = (signature, index)
+        return doc_dir, index
+
+    def get(self, pdf_path, page_count, page_idx, size):
+        """Return a cached thumbnail as a PIL image, or None on a miss
+
+        A cached image larger than the requested size is downscaled instead of
+        re-rasterising the page.
+        """
+        if not self.enabled or not pdf_path or not os.path.isfile(pdf_path):
+            return None
+        try:
+            with self.lock:
+                doc_dir, index = self._load_index(pdf_path, page_count)
+                larger_sizes = sorted(s for s in index.get(page_idx, ()) if s >= size)
+            if not larger_sizes:
+                return None
+
+            cached_size = larger_sizes[0]
+            image_path = doc_dir / f"{page_idx}_{cached_size}.jpg"
+            img = Image.open(image_path)
+            img.load()
+            os.utime(image_path)  # Mark as recently used for eviction
+
+            if cached_size != size:
+                img.thumbnail((size, size), Image.Resampling.LANCZOS)
+            return img
+        except (OSError, ValueError):
+            return None
+
+    def contains(self, pdf_path, page_count, page_idx, size):
+        """Return True if a thumbnail at least as large as size is cached"""
+        if not self.enabled or not pdf_path or not os.path.isfile(pdf_path):
+            return False
+        try:
+            with self.lock:
+                _, index = self._load_index(pdf_path, page_count)
+                return any(s >= size for s in index.get(page_idx, ()))
+        except (OSError, ValueError):
+            return False
+
+    def put(self, pdf_path, page_count, page_idx, size, pil_img):
+        """Store a rendered thumbnail in the cache"""
+        if not self.enabled or not pdf_path or not os.path.isfile(pdf_path):
+            return
+        try:
+            with self.lock:
+                doc_dir, index = self._load_index(pdf_path, page_count)
+                if size in index.get(page_idx, ()):
+                    # Already cached (e.g. a prefetch and a visible render raced) - keep the existing file
+                    return
+            pil_img.convert('RGB').save(doc_dir / f"{page_idx}_{size}.jpg", 'JPEG',
+                                        quality=self.JPEG_QUALITY)
+            with self.lock:
+                index.setdefault(page_idx, set()).add(size)
+        except (OSError, ValueError):
+            pass
+
+    def _crop_filename(self, page_idx, clip):
+        """Cache file name for a crop preview: its page plus a digest of the crop rectangle"""
+        digest = hashlib.sha1(repr(tuple(round(c, 2) for c in clip)).encode('utf-8')).hexdigest()
+        return f"{page_idx}_crop_{digest[:16]}.png"
+
+    def get_crop(self, pdf_path, page_count, page_idx, clip):
+        """Return a cached crop preview as a PIL image, or None on a miss"""
+        if not self.enabled or not pdf_path or not os.path.isfile(pdf_path):
+            return None
+        try:
+            with self.lock:
+                doc_dir, _ = self._load_index(pdf_path, page_count)
+            image_path = doc_dir / self._crop_filename(page_idx, clip)
+            img = Image.open(image_path)
+            img.load()
+            os.utime(image_path)  # Mark as recently used for eviction
+            return img
+        except (OSError, ValueError):
+            return None
+
+    def put_crop(self, pdf_path, page_count, page_idx, clip, pil_img):
+        """Store a rendered crop preview in the cache (PNG - crop previews are small)"""
+        if not self.enabled or not pdf_path or not os.path.isfile(pdf_path):
+            return
+        try:
+            with self.lock:
+                doc_dir, _ = self._load_index(pdf_path, page_count)
+            pil_img.save(doc_dir / self._crop_filename(page_idx, clip), 'PNG')
+        except (OSError, ValueError):
+            pass
+
+    def evict(self):
+        """Remove least recently used thumbnails until the cache fits its size budget
+
+        Returns at once if another thread is already evicting.
+        """
+        if not self.enabled or not self.evict_lock.acquire(blocking=False):
+            return
+        try:
+            entries = []
+            total_bytes = 0
+            for doc_entry in os.scandir(self.cache_dir):
+                if not doc_entry.is_dir():
+                    continue
+                for entry in os.scandir(doc_entry.path):
+                    if entry.name == self.META_FILENAME:
+                        continue
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path, doc_entry.path))
+                    total_bytes += stat.st_size
+
+            if total_bytes <= self.max_bytes:
+                return
+
+            entries.sort()
+            with self.lock:
+                for _, file_size, file_path, doc_path in entries:
+                    if total_bytes <= self.max_bytes:
+                        break
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        continue
+                    total_bytes -= file_size
+
+                    # Keep the in-memory index in sync with the files on disk
+                    validated = self.validated.get(Path(doc_path))
+                    if validated is not None:
+                        index = validated[1]
+                        name = os.path.splitext(os.path.basename(file_path))[0]
+                        try:
+                            page_idx, size = (int(part) for part in name.split('_'))
+                        except ValueError:
+                            continue
+                        index.get(page_idx, set()).discard(size)
+        except OSError:
+            pass
+        finally:
+            self.evict_lock.release()
+
 
 class VisualPDFSplitterApp:
     # UI Constants
@@ -32,6 +533,50 @@ class VisualPDFSplitterApp:
     EVENT_MOUSE_WHEEL = '<MouseWheel>'
     EVENT_BUTTON_4 = '<Button-4>'
     EVENT_BUTTON_5 = '<Button-5>'
+
+    # Renders submitted to the process pool at once (at least two per worker so none
+    # sits idle between results); the rest wait in the priority queue
+    MAX_INFLIGHT_RENDERS = 8
+    # Disk cache hits decoded on the Tk thread per queue pass; the rest wait for idle time
+    MAX_CACHE_LOADS_PER_PASS = 4
+    # Quiet period before a zoom change re-renders thumbnails
+    ZOOM_DEBOUNCE_MS = 120
+    # Quiet period before a canvas resize re-lays out the thumbnail grid
+    RESIZE_DEBOUNCE_MS = 150
+    # Minimum interval between drag feedback updates (~60 fps)
+    DRAG_FRAME_MS = 16
+    # Documents kept open for quick Prev/Next navigation
+    MAX_OPEN_DOCUMENTS = 8
+    # Leading pages of the previous/next PDF in a folder rendered ahead of navigation
+    PREFETCH_PAGES = 4
+    # Rendered thumbnails kept in memory: at least this many, or three screens' worth
+    MIN_LIVE_THUMBNAILS = 32
+    # Rows of page widgets kept built above and below the visible part of the grid
+    OVERSCAN_ROWS = 2
+    # Bindtags carrying the shared page widget mouse bindings (see bind_page_events)
+    PAGE_EVENT_TAGS = ('PageClick', 'PageDrag', 'PageHover')
+    # Canvas tags of the drawn crop preview rows and of their delete glyphs
+    CROP_ROW_TAG = 'crop_row'
+    CROP_DELETE_TAG = 'crop_delete'
+    # Size of the grey box drawn for a crop whose preview is not rendered yet
+    CROP_PLACEHOLDER_SIZE = (110, 120)
+    # Page widget fonts and spacing per view mode, computed once instead of per widget
+    PAGE_WIDGET_STYLE = {
+        'single': {'label_font': (FONT_FAMILY, 11, 'bold'), 'small_font': (FONT_FAMILY, 10, 'bold'),
+                   'button_width': 3, 'label_pady': (8, 2), 'controls_pady': (0, 4),
+                   'thumb_pady': (4, 4), 'status_pady': (0, 8)},
+        'grid': {'label_font': (FONT_FAMILY, 9, 'bold'), 'small_font': (FONT_FAMILY, 8, 'bold'),
+                 'button_width': 2, 'label_pady': (5, 1), 'controls_pady': (0, 2),
+                 'thumb_pady': (2, 2), 'status_pady': (0, 5)},
+    }
+    # Recently viewed PDFs whose rendered thumbnails are kept for instant Prev/Next redisplay
+    MAX_CACHED_PDFS = 5
+    # Write buffer for split ZIPs: MuPDF writes PDF objects in small pieces
+    ZIP_WRITE_BUFFER = 4 * 1024 * 1024
+    # Chunk size for copying a whole source PDF into a split ZIP
+    ZIP_COPY_CHUNK = 1024 * 1024
+    # Smallest crop kept, in square PDF points, once clipped to the page
+    MIN_CROP_AREA = 25
     
     def __init__(self, root):
         self.root = root
@@ -47,16 +592,23 @@ class VisualPDFSplitterApp:
         # New: Multiple PDF support
         self.pdf_list = []  # List of PDF file paths
         self.current_pdf_index = 0  # Current PDF being viewed
-        self.pdf_documents = {}  # Cache for opened PDF documents
+        self.pdf_documents = OrderedDict()  # LRU cache of opened PDF documents, see get_document()
         
         self.page_thumbnails = []
+        self.live_thumbnails = OrderedDict()  # Page indices holding a PhotoImage, least recently seen first
+        self.visible_pages = set()  # Page indices on screen at the last visibility pass
+        self.recent_thumbnails = OrderedDict()  # {(source_path, mtime, size): (page_thumbnails, live_thumbnails)}
         self.selected_ranges = []
+        self._range_rows = []  # (range dict, tree item id, values) per ranges_tree row, in order
+        self._selection_styles = None  # (selection state, {page_num: style}) from selection_styles()
         self.current_selection = {'start': None, 'end': None}
         self.thumbnail_size = 150
         self.max_zoom = 1600  # Increased from 800 to 1600
         self.min_zoom = 100
         self.zoom_step = 50
         self.page_widgets = []  # Store page widget references
+        self.page_widgets_by_num = {}  # {page_num: page widget} for O(1) lookups from event handlers
+        self.page_widget_of = {}  # {Tk widget: page widget it is part of} for the shared bindings
         self.view_mode = 'grid'  # Default view mode
         
         # NEW: Page editing system (reordering and deletion)
@@ -65,7 +617,11 @@ class VisualPDFSplitterApp:
         self.deleted_pages = set()  # Set of deleted page indices (0-based)
         self.drag_data = None  # Stores drag information
         self.drop_indicator = None  # Visual drop indicator
-        self.drag_ghost = None  # Ghost image during drag
+        self.drag_ghost = None  # Ghost window during drag, created once and reused
+        self.drag_ghost_label = None
+        self.drag_ghost_visible = False
+        self._drag_motion_after = None  # Pending after() id for the throttled drag update
+        self._last_drag_event = None
         self.original_order = []  # Backup of original order
         self.original_rotations = {}  # Backup of original rotations
         self.page_rotations = {}  # Current page rotations (page_number: angle)
@@ -74,11 +630,16 @@ class VisualPDFSplitterApp:
         # New: Crop functionality
         self.crop_mode = False
         self.crop_rectangles = {}  # Store crop rectangles per page: {page_num: [rectangles]}
+        self._total_crops = 0  # Crops in crop_rectangles, kept up to date as crops are added and removed
         self.crop_thumbnails = {}  # Store crop thumbnail images: {crop_id: PhotoImage}
         self.crop_counter = 0  # Counter for unique crop IDs
         self.current_crop = None  # Current crop being drawn
         self.crop_start_pos = None
         self.crop_canvas_items = {}  # Canvas items for crop rectangles
+        self._crop_canvas_width = None  # Width the crop preview rows were last drawn for
+        self._crop_row_layout = []  # (top, bottom, crop data, label) per crop preview row, top to bottom
+        self._crop_row_bounds = ([], [])  # Row tops and row bottoms of _crop_row_layout, for bisect
+        self._drawn_crop_rows = None  # (first, last) indices of the rows currently drawn
         self.crop_overlay = None  # Current crop overlay rectangle
         self.crop_overlay_canvas = None  # Canvas for crop overlay
         
@@ -89,7 +650,38 @@ class VisualPDFSplitterApp:
         
         # Per-PDF modification tracking
         self.pdf_modifications = {}  # Dict: {original_path: {'temp_path': str, 'original_path': str}}
-        
+
+        # Persistent thumbnail cache shared across sessions
+        self.thumbnail_cache = ThumbnailCache()
+        # Render matrices keyed by (page width, page height, thumbnail size)
+        self._thumbnail_matrices = {}
+
+        # Process pool for parallel page rasterisation (created on first use)
+        self._render_pool = None
+
+        # On-demand thumbnail rendering for pages near the visible canvas region
+        self.render_queue = deque()  # Original page indices waiting to render, highest priority first
+        self._inflight = {}  # {(source_path, page_index, size): Future} renders running in the pool
+        self.failed_thumbnails = set()  # Page indices whose thumbnail could not be rendered
+        self.placeholder_thumbnail = None  # (thumbnail_size, PhotoImage) shown until a page renders
+        self._visible_render_after = None  # Pending after() id for the next visibility pass
+        self._render_queue_after = None  # Pending after_idle() id resuming a capped queue pass
+        self._zoom_after = None  # Pending after() id for the debounced zoom change
+        self._resize_after = None  # Pending after() id for the debounced canvas resize
+        self._split_running = False  # True while a split ZIP is written on a background thread
+        self._export_running = False  # True while crop files are written by the render pool
+        self._closing = False  # Set when the window is closed during a split (see request_close)
+        self._layout = None  # (margin, columns, cell width) of the displayed thumbnail grid
+        self._grid_entries = []  # (display position, original page index) per grid slot
+        self._row_pitch = None  # Height of one grid row in pixels (all rows are equally tall)
+        self._grid_rows = 0  # Rows given a minimum height in thumbnails_frame
+        self._widget_pool = []  # Hidden page widgets ready to be reused for another slot
+        self._frozen_depth = 0  # Nesting depth of frozen_layout() blocks
+        self.pending_zoom_size = self.thumbnail_size
+        self._prefetch_gen = 0  # Bumped on every PDF switch so stale neighbour prefetches are skipped
+        self._prefetched_gen = 0  # Generation whose neighbours have already been prefetched
+        self._evicted_gen = 0  # Generation after which the disk cache was last trimmed
+
         # Colors for selection states
         self.colors = {
             'normal': '#f0f0f0',
@@ -106,11 +698,24 @@ class VisualPDFSplitterApp:
             'deleted': '#FFB6C1'       # Light pink for deleted pages
         }
         
+        # Selection styles for page widgets: (color key, status text, status color, border width, relief)
+        self.page_styles = {
+            'normal': ('normal', "", 'black', 2, tk.RAISED),
+            'edit_mode': ('edit_mode', "", 'black', 2, tk.RAISED),
+            'start': ('start', "START", 'darkgreen', 3, tk.SOLID),
+            'single': ('start', "SINGLE", 'darkgreen', 3, tk.SOLID),
+            'end': ('end', "END", 'darkred', 3, tk.SOLID),
+            'selected': ('selected', "SELECTED", 'darkorange', 3, tk.SOLID)
+        }
+        
         # Setup GUI
         self.setup_styles()
         self.create_widgets()
         self.setup_keyboard_shortcuts()
         
+        # Start the render workers while the user is still picking a file
+        self.root.after_idle(self.warm_up_render_pool)
+        
     def setup_styles(self):
         """Configure modern styling"""
         style = ttk.Style()
@@ -450,7 +1055,8 @@ class VisualPDFSplitterApp:
         scrollbar_v = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
         scrollbar_h = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
         
-        self.canvas.configure(yscrollcommand=scrollbar_v.set, xscrollcommand=scrollbar_h.set)
+        self.canvas_scrollbar_v = scrollbar_v
+        self.canvas.configure(yscrollcommand=self.on_canvas_yscroll, xscrollcommand=scrollbar_h.set)
         
         # Grid the canvas and scrollbars
         self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -535,37 +1141,30 @@ class VisualPDFSplitterApp:
         crop_canvas_frame.rowconfigure(0, weight=1)
         
         self.crop_canvas = tk.Canvas(crop_canvas_frame, bg='white', highlightthickness=0, height=300)
-        crop_scrollbar_v = ttk.Scrollbar(crop_canvas_frame, orient=tk.VERTICAL, command=self.crop_canvas.yview)
+        self.crop_scrollbar_v = ttk.Scrollbar(crop_canvas_frame, orient=tk.VERTICAL, command=self.crop_canvas.yview)
         
-        self.crop_canvas.configure(yscrollcommand=crop_scrollbar_v.set)
+        self.crop_canvas.configure(yscrollcommand=self.on_crop_canvas_yscroll)
         
         self.crop_canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        crop_scrollbar_v.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.crop_scrollbar_v.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
-        # Frame for crop thumbnails inside canvas
-        self.crop_thumbnails_frame = tk.Frame(self.crop_canvas, bg='white')
-        self.crop_canvas_window = self.crop_canvas.create_window((0, 0), window=self.crop_thumbnails_frame, anchor=tk.NW)
         
         # Bind canvas events
         self.canvas.bind(self.EVENT_CONFIGURE, self.on_canvas_configure)
         self.thumbnails_frame.bind(self.EVENT_CONFIGURE, self.on_frame_configure)
         self.crop_canvas.bind(self.EVENT_CONFIGURE, self.on_crop_canvas_configure)
-        self.crop_thumbnails_frame.bind(self.EVENT_CONFIGURE, self.on_crop_frame_configure)
-        
-        # Mouse wheel scrolling with enhanced sensitivity - bind to multiple elements
-        # for better coverage
-        scroll_widgets = [self.canvas, canvas_frame, preview_frame, self.thumbnails_frame]
-        for widget in scroll_widgets:
-            widget.bind(self.EVENT_MOUSE_WHEEL, self.on_mousewheel)
-            widget.bind(self.EVENT_BUTTON_4, self.on_mousewheel)  # Linux
-            widget.bind(self.EVENT_BUTTON_5, self.on_mousewheel)  # Linux
-        
-        # Mouse wheel for crop canvas
-        crop_scroll_widgets = [self.crop_canvas, crop_canvas_frame, self.crop_thumbnails_frame]
-        for widget in crop_scroll_widgets:
-            widget.bind(self.EVENT_MOUSE_WHEEL, self.on_crop_mousewheel)
-            widget.bind(self.EVENT_BUTTON_4, self.on_crop_mousewheel)  # Linux
-            widget.bind(self.EVENT_BUTTON_5, self.on_crop_mousewheel)  # Linux
+        self.bind_crop_row_events()
+        
+        # Mouse wheel scrolling with enhanced sensitivity - one application-wide binding
+        # routed by the area under the pointer, so page thumbnails need no bindings of their own
+        self.wheel_scroll_areas = [(crop_canvas_frame, self.on_crop_mousewheel),
+                                   (preview_frame, self.on_mousewheel)]
+        self.root.bind_all(self.EVENT_MOUSE_WHEEL, self.on_global_mousewheel)
+        self.root.bind_all(self.EVENT_BUTTON_4, self.on_global_mousewheel)  # Linux
+        self.root.bind_all(self.EVENT_BUTTON_5, self.on_global_mousewheel)  # Linux
+        
+        # Page thumbnail mouse handling - class bindings shared by every page widget
+        self.bind_page_events()
         
         # Keyboard navigation
         self.canvas.bind('<Page_Up>', lambda e: self.canvas.yview_scroll(-10, "units"))
@@ -579,6 +1178,16 @@ class VisualPDFSplitterApp:
         # Make canvas focusable for keyboard events
         self.canvas.focus_set()
 
+    def on_canvas_yscroll(self, first, last):
+        """Update the scrollbar and render pages scrolled into view"""
+        self.canvas_scrollbar_v.set(first, last)
+        self.schedule_visible_renders()
+
+    def on_crop_canvas_yscroll(self, first, last):
+        """Update the crop scrollbar and draw the crop rows scrolled into view"""
+        self.crop_scrollbar_v.set(first, last)
+        self.draw_visible_crop_rows()
+
     def handle_canvas_click(self, event):
         """Handle canvas clicks without stealing focus from entry fields"""
         # Check if focus is currently on an entry widget
@@ -606,6 +1215,12 @@ class VisualPDFSplitterApp:
         """Toggle page edit mode (reorder + delete + rotate)"""
         desired_mode = self.edit_mode_var.get()
         
+        # Saving edits replaces the files a running split or crop export reads
+        if desired_mode and not self.edit_mode and (self._split_running or self._export_running):
+            self.edit_mode_var.set(False)
+            messagebox.showinfo("Info", "Please wait for the split or crop export to finish before editing pages.")
+            return
+        
         # If leaving edit mode and there are changes, prompt user
         if self.edit_mode and not desired_mode:
             if self.has_edited or self.deleted_pages or self.page_rotations:
@@ -650,8 +1265,26 @@ class VisualPDFSplitterApp:
             
         # Update display to reflect mode change without rebuilding thumbnails
         if self.page_thumbnails:
-            # Just refresh the display layout, don't rebuild thumbnails
+            self.show_edit_mode_widgets()
+    
+    def show_edit_mode_widgets(self):
+        """Switch the existing page widgets to the current edit mode in place"""
+        if not self._row_pitch or not self.page_widgets_by_num:
             self.display_thumbnails(force_rebuild=True)
+            return
+        
+        with self.frozen_layout():
+            # Hidden widgets are switched too, so reusing one needs no mode check
+            for widget in self._widget_pool:
+                self.set_edit_controls(widget)
+            for widget in self.page_widgets_by_num.values():
+                self.set_edit_controls(widget)
+                widget['page_label'].config(text=self.page_label_text(widget['slot'], widget['page_num']))
+            self.update_selection_display()
+            
+            # The edit controls change the height of every row
+            row_pitch = self.measure_row_pitch(next(iter(self.page_widgets_by_num.values())))
+            self.relayout_thumbnail_grid(row_pitch)
     
     def update_buttons_for_edit_mode(self):
         """Enable or disable buttons based on edit mode state"""
@@ -669,6 +1302,7 @@ class VisualPDFSplitterApp:
                     button.config(state='disabled')
                 else:
                     button.config(state='normal')
+        self.update_buttons_for_background_tasks()
     
     def update_buttons_for_crop_mode(self):
         """Enable or disable buttons based on crop mode state"""
@@ -686,6 +1320,23 @@ class VisualPDFSplitterApp:
                     button.config(state='disabled')
                 else:
                     button.config(state='normal')
+        self.update_buttons_for_background_tasks()
+    
+    def update_buttons_for_background_tasks(self):
+        """Disable the buttons that would start a second split or export, or edit files one reads
+
+        Called after the mode button updates, so the mode rules are applied here as well.
+        """
+        busy = self._split_running or self._export_running
+        button_disabled = {
+            'split_save_btn': self._split_running or self.crop_mode or self.edit_mode,
+            'extract_pdf_btn': self._export_running or self.edit_mode,
+            'extract_png_btn': self._export_running or self.edit_mode,
+            'edit_toggle_btn': busy or self.crop_mode,
+        }
+        for btn_name, disabled in button_disabled.items():
+            if hasattr(self, btn_name):
+                getattr(self, btn_name).config(state='disabled' if disabled else 'normal')
     
     def prompt_edit_exit(self):
         """Prompt user when exiting edit mode with unsaved changes"""
@@ -757,7 +1408,7 @@ class VisualPDFSplitterApp:
             
             # Regenerate thumbnails with original rotations if needed
             if self.original_rotations != self.page_rotations:
-                threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+                self.generate_thumbnails()
             else:
                 # Just refresh display
                 self.display_thumbnails(force_rebuild=True)
@@ -777,54 +1428,21 @@ class VisualPDFSplitterApp:
                 return
             
             self.status_var.set("Applying changes to PDF...")
-            self.root.update()
+            self.root.update_idletasks()
             
             # Create a new PDF document with the changes applied
             import tempfile
             temp_path = tempfile.mktemp(suffix=".pdf")
             
-            # Create new document using PyPDF2 to apply changes
-            from PyPDF2 import PdfWriter, PdfReader
-            
-            # First, save the current PDF document (which might be already modified) to a temp file
-            current_temp_path = tempfile.mktemp(suffix="_current.pdf")
-            self.pdf_document.save(current_temp_path)
-            
-            # Read from the current PDF (original or previously modified)
-            with open(current_temp_path, 'rb') as file:
-                pdf_reader = PdfReader(file)
-                pdf_writer = PdfWriter()
-                
-                # Add pages in the new order, skipping deleted pages, with rotations
-                for page_index in self.page_order:
-                    if page_index in self.deleted_pages:
-                        continue
-                    
-                    page = pdf_reader.pages[page_index]
-                    
-                    # Apply rotation if set for this page (1-based page number)
-                    page_number = page_index + 1
-                    if page_number in self.page_rotations:
-                        rotation_angle = self.page_rotations[page_number]
-                        page.rotate(rotation_angle)
-                    
-                    pdf_writer.add_page(page)
-                
-                # Write to final temporary file
-                with open(temp_path, 'wb') as output_file:
-                    pdf_writer.write(output_file)
+            # Write the loaded document (original or previously modified) with the edits applied
+            pdf_data = self.edited_pdf_bytes()
+            with open(temp_path, 'wb') as output_file:
+                output_file.write(pdf_data)
             
-            # Clean up the temporary current file
-            try:
-                os.remove(current_temp_path)
-            except FileNotFoundError:
-                # File already removed, which is fine
-                pass
-            except PermissionError as e:
-                print(f"Warning: Could not remove temporary file due to permissions: {current_temp_path}")
-                self.status_var.set("Warning: Some temporary files could not be cleaned up")
-            except Exception as e:
-                print(f"Warning: Error removing temporary file {current_temp_path}: {e}")
+            # Page content is unchanged, so the thumbnails on screen (with their edit
+            # rotations) are exactly what the new document renders - carry them over
+            kept_thumbnails = [self.page_thumbnails[page_index] if page_index < len(self.page_thumbnails) else None
+                               for page_index in self.kept_page_indices()]
             
             # Track modification for this specific PDF
             current_pdf_path = self.pdf_path
@@ -843,12 +1461,17 @@ class VisualPDFSplitterApp:
             # Update the cache with the new document, keeping the original path as key
             # This ensures folder navigation continues to work properly
             self.pdf_documents[current_pdf_path] = self.pdf_document
+            self.pdf_documents.move_to_end(current_pdf_path)
             
-            # Reset edit state since changes are now applied
+            # Reset edit state since changes are now applied (rotations are now part of the pages)
+            self.page_rotations = {}
             self.initialize_edit_session()
             
-            # Regenerate thumbnails for the modified PDF
-            threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+            # Regenerate thumbnails for the modified PDF, reusing the carried-over renders
+            kept_live = OrderedDict((new_index, None) for new_index, photo in enumerate(kept_thumbnails)
+                                    if photo is not None)
+            self.recent_thumbnails[self.thumbnail_set_key()] = (kept_thumbnails, kept_live)
+            self.generate_thumbnails()
             
             # Update file label to show modified state
             self.update_file_label()
@@ -858,6 +1481,41 @@ class VisualPDFSplitterApp:
             messagebox.showerror("Error", f"Failed to apply changes to PDF: {str(e)}")
             self.status_var.set("Error applying changes")
     
+    def kept_page_indices(self):
+        """Return the original indices of the pages left after the edits, in display order"""
+        return [page_index for page_index in self.page_order
+                if page_index not in self.deleted_pages and page_index < len(self.pdf_document)]
+
+    def edited_pdf_bytes(self):
+        """Return the loaded PDF with the current order, deletions and rotations applied
+
+        Pages are copied from the already open document, so the file is not parsed again.
+        """
+        source = self.pdf_document
+        kept_pages = self.kept_page_indices()
+        
+        output_doc = fitz.open()
+        try:
+            # Copy each run of consecutive source pages with a single insert_pdf() call
+            run_start = None
+            for position, page_index in enumerate(kept_pages):
+                if run_start is None:
+                    run_start = page_index
+                if position + 1 == len(kept_pages) or kept_pages[position + 1] != page_index + 1:
+                    output_doc.insert_pdf(source, from_page=run_start, to_page=page_index)
+                    run_start = None
+            
+            # Apply rotation if set for this page (1-based)
+            for new_index, page_index in enumerate(kept_pages):
+                rotation_angle = self.page_rotations.get(page_index + 1, 0)
+                if rotation_angle in (90, 180, 270):
+                    page = output_doc[new_index]
+                    page.set_rotation((page.rotation + rotation_angle) % 360)
+            
+            return output_doc.tobytes(garbage=4, deflate=True)
+        finally:
+            output_doc.close()
+    
     def update_file_label(self):
         """Update file label to show current state and modifications"""
         if not self.pdf_document:
@@ -893,21 +1551,34 @@ class VisualPDFSplitterApp:
         # Show as temporary status message
         self.edit_status_label.config(text="Drag to reorder • Click ❌ to delete • Rotate with ↺↻ • Blue zones show drop locations")
     
-    def setup_drag_and_drop(self, widget, page_index):
-        """Setup drag and drop bindings for a page widget"""
-        if not self.edit_mode:
-            return
-            
-        # Get the main frame for the page
-        frame = widget['frame']
-        
-        # Bind drag events to the main frame and its children (but not delete button)
-        drag_widgets = [frame, widget['page_label'], widget['thumb_label']]
-        
-        for drag_widget in drag_widgets:
-            drag_widget.bind(self.EVENT_BUTTON_1, lambda e, idx=page_index: self.start_drag(e, idx))
-            drag_widget.bind('<B1-Motion>', lambda e, idx=page_index: self.on_drag(e, idx))
-            drag_widget.bind('<ButtonRelease-1>', lambda e, idx=page_index: self.end_drag(e, idx))
+    def bind_page_events(self):
+        """Register the page thumbnail mouse handlers once, as bindings on shared bindtags
+
+        Page widgets only carry the tags (see create_page_widget); the handlers look up
+        the page a widget currently shows in page_widget_of, so building or reusing a
+        page widget creates no Tcl commands.
+        """
+        page_events = {
+            # Regular mode: click/shift-click selection
+            ('PageClick', self.EVENT_BUTTON_1): lambda e, w: self.handle_click(e, w['page_num']),
+            ('PageClick', '<B1-Motion>'): lambda e, w: self.handle_drag(e, w['page_num']),
+            ('PageClick', '<ButtonRelease-1>'): lambda e, w: self.handle_release(e, w['page_num']),
+            # Edit mode: drag to reorder (uses the display position)
+            ('PageDrag', self.EVENT_BUTTON_1): lambda e, w: self.start_drag(e, w['display_position']),
+            ('PageDrag', '<B1-Motion>'): lambda e, w: self.on_drag(e, w['display_position']),
+            ('PageDrag', '<ButtonRelease-1>'): lambda e, w: self.end_drag(e, w['display_position']),
+            # Both modes
+            ('PageHover', '<Enter>'): lambda e, w: self.on_page_hover(w['page_num'], True),
+            ('PageHover', '<Leave>'): lambda e, w: self.on_page_hover(w['page_num'], False),
+        }
+        for (tag, sequence), action in page_events.items():
+            self.root.bind_class(tag, sequence, lambda e, action=action: self.dispatch_page_event(e, action))
+    
+    def dispatch_page_event(self, event, action):
+        """Run a page thumbnail handler for the page the event's widget belongs to"""
+        page_widget = self.page_widget_of.get(event.widget)
+        if page_widget is not None:
+            return action(event, page_widget)
     
     def delete_page(self, page_index):
         """Delete a page from the current edit session"""
@@ -929,7 +1600,7 @@ class VisualPDFSplitterApp:
             self.has_edited = True
             
             # Update display
-            self.regenerate_ordered_thumbnails()
+            self.display_thumbnails(force_rebuild=True)
             self.update_edit_status()
             
             # Update status
@@ -1054,8 +1725,9 @@ class VisualPDFSplitterApp:
                 # Add pages to deleted set
                 self.deleted_pages.update(actual_page_indices_to_delete)
                 
-                # Remove from current page order
-                self.page_order = [p for p in self.page_order if p not in actual_page_indices_to_delete]
+                # Remove from current page order (set lookup keeps large bulk deletes linear)
+                pages_to_delete = set(actual_page_indices_to_delete)
+                self.page_order = [p for p in self.page_order if p not in pages_to_delete]
                 
                 # Mark as edited
                 self.has_edited = True
@@ -1064,7 +1736,7 @@ class VisualPDFSplitterApp:
                 self.bulk_delete_entry.delete(0, tk.END)
                 
                 # Update display
-                self.regenerate_ordered_thumbnails()
+                self.display_thumbnails(force_rebuild=True)
                 self.update_edit_status()
                 
                 # Update status
@@ -1088,14 +1760,19 @@ class VisualPDFSplitterApp:
             'source_page_num': self.page_order[page_index],
             'start_x': event.x_root,
             'start_y': event.y_root,
-            'has_moved': False
+            'has_moved': False,
+            'drop_target': None,  # Display index currently highlighted as the drop zone
+            # Canvas screen origin and size, measured once so hit-testing needs no
+            # per-motion geometry queries
+            'canvas_origin': (self.canvas.winfo_rootx(), self.canvas.winfo_rooty()),
+            'canvas_size': (self.canvas.winfo_width(), self.canvas.winfo_height())
         }
         
         # Visual feedback - highlight source page
         source_widget = self.page_widgets[page_index]
         if source_widget:
             self.set_page_color(source_widget, self.colors['drag_source'])
-            source_widget['frame'].config(relief=tk.SOLID, borderwidth=3)
+            self.set_page_border(source_widget, 3, tk.SOLID)
         
         # Change cursor
         self.root.config(cursor="hand2")
@@ -1115,39 +1792,61 @@ class VisualPDFSplitterApp:
                 self.create_drag_ghost(event)
         
         if self.drag_data['has_moved']:
-            # Update ghost position
-            self.update_drag_ghost(event)
-            
-            # Highlight drop zones
-            self.highlight_drop_zones(event)
+            # Motion events arrive far faster than the screen refreshes; handle only the
+            # latest one per frame
+            self._last_drag_event = event
+            if self._drag_motion_after is None:
+                self._drag_motion_after = self.root.after(self.DRAG_FRAME_MS, self.apply_drag_motion)
+    
+    def apply_drag_motion(self):
+        """Move the ghost and update drop highlights for the latest drag position"""
+        self._drag_motion_after = None
+        if not self.drag_data or not self.drag_data['has_moved']:
+            return
+        
+        event = self._last_drag_event
+        
+        # Update ghost position
+        self.update_drag_ghost(event)
+        
+        # Highlight drop zones
+        self.highlight_drop_zones(event)
     
     def create_drag_ghost(self, event):
-        """Create a ghost image while dragging"""
+        """Show the ghost image while dragging"""
         try:
-            # Create a semi-transparent window following the cursor
-            self.drag_ghost = tk.Toplevel(self.root)
-            self.drag_ghost.wm_overrideredirect(True)
-            self.drag_ghost.attributes('-alpha', 0.7)
-            self.drag_ghost.attributes('-topmost', True)
+            # The semi-transparent window is created once and only hidden between drags,
+            # avoiding a window manager round-trip and flicker on every drag start
+            if self.drag_ghost is None:
+                self.drag_ghost = tk.Toplevel(self.root)
+                self.drag_ghost.wm_overrideredirect(True)
+                self.drag_ghost.attributes('-alpha', 0.7)
+                self.drag_ghost.attributes('-topmost', True)
+                self.drag_ghost.withdraw()
+                
+                self.drag_ghost_label = tk.Label(self.drag_ghost,
+                                                 compound=tk.TOP,
+                                                 font=(self.FONT_FAMILY, 10, 'bold'),
+                                                 bg=self.colors['drag_source'],
+                                                 relief=tk.SOLID,
+                                                 borderwidth=2)
+                self.drag_ghost_label.pack()
             
             # Get the thumbnail image
             source_index = self.drag_data['source_index']
             source_widget = self.page_widgets[source_index]
             
-            if source_widget and 'thumb_label' in source_widget:
-                # Create a label with the thumbnail
-                ghost_label = tk.Label(self.drag_ghost, 
-                                     image=source_widget['thumb_label']['image'],
-                                     text=f"Page {self.drag_data['source_page_num'] + 1}",
-                                     compound=tk.TOP,
-                                     font=(self.FONT_FAMILY, 10, 'bold'),
-                                     bg=self.colors['drag_source'],
-                                     relief=tk.SOLID,
-                                     borderwidth=2)
-                ghost_label.pack()
-            
-            # Position the ghost
+            if not source_widget or 'thumb_label' not in source_widget:
+                return
+            
+            # Show the dragged page's thumbnail
+            self.drag_ghost_label.config(image=source_widget['thumb_label']['image'],
+                                         text=f"Page {self.drag_data['source_page_num'] + 1}")
+            
+            # Position the ghost before showing it so it does not flash at the old spot
+            self.drag_ghost_visible = True
             self.update_drag_ghost(event)
+            self.drag_ghost.deiconify()
             
         except Exception as e:
             # Log drag ghost creation errors but don't interrupt user experience
@@ -1156,7 +1855,7 @@ class VisualPDFSplitterApp:
     
     def update_drag_ghost(self, event):
         """Update ghost position"""
-        if self.drag_ghost:
+        if self.drag_ghost_visible:
             # Position slightly offset from cursor
             x = event.x_root + 10
             y = event.y_root + 10
@@ -1164,45 +1863,55 @@ class VisualPDFSplitterApp:
     
     def highlight_drop_zones(self, event):
         """Highlight valid drop zones during drag"""
-        # Clear previous highlights
-        self.clear_drop_highlights()
-        
         # Find the drop target
         target_index = self.find_drop_target(event)
+        if target_index == self.drag_data['source_index']:
+            target_index = None
+        
+        # Only the previous and the new target change - leave every other page alone
+        if target_index == self.drag_data['drop_target']:
+            return
         
-        if target_index is not None and target_index != self.drag_data['source_index']:
+        # Clear previous highlights
+        self.clear_drop_highlights()
+        
+        if target_index is not None:
             # Highlight drop zone
             self.show_drop_indicator(target_index)
+            self.drag_data['drop_target'] = target_index
     
     def find_drop_target(self, event):
         """Find which page index the cursor is over"""
         try:
             # Convert screen coordinates to canvas coordinates
-            canvas_x = self.canvas.canvasx(event.x_root - self.canvas.winfo_rootx())
-            canvas_y = self.canvas.canvasy(event.y_root - self.canvas.winfo_rooty())
+            origin_x, origin_y = self.drag_data['canvas_origin']
+            view_x = event.x_root - origin_x
+            view_y = event.y_root - origin_y
+            
+            # Outside the visible canvas there is nothing to drop on (the rows above and
+            # below the viewport are scrolled out of sight)
+            view_width, view_height = self.drag_data['canvas_size']
+            if not (0 <= view_x < view_width and 0 <= view_y < view_height):
+                return None
             
-            # Find the widget under the cursor
-            for i, widget in enumerate(self.page_widgets):
-                if widget is None:
-                    continue
-                    
-                frame = widget['frame']
-                
-                # Get frame position relative to canvas
-                frame_x = frame.winfo_x()
-                frame_y = frame.winfo_y()
-                frame_width = frame.winfo_width()
-                frame_height = frame.winfo_height()
-                
-                # Check if cursor is over this frame
-                if (frame_x <= canvas_x <= frame_x + frame_width and
-                    frame_y <= canvas_y <= frame_y + frame_height):
-                    return i
+            canvas_x = self.canvas.canvasx(view_x)
+            canvas_y = self.canvas.canvasy(view_y)
+            
+            # The thumbnails frame sits at the canvas origin, so let the grid manager map
+            # the point to a cell - one query regardless of page count, and it copes with
+            # rows of different heights
+            col, row = self.thumbnails_frame.grid_location(int(canvas_x), int(canvas_y))
+            cols = self._layout[1] if self._layout else 1
+            if row < 0 or not 0 <= col < cols:
+                return None
             
+            i = row * cols + col
+            if i < len(self.page_widgets) and self.page_widgets[i] is not None:
+                return i
             return None
             
-        except Exception as e:
-            pass
+        except tk.TclError:
+            # The canvas or grid went away mid-drag (e.g. the grid is being rebuilt)
             return None
     
     def show_drop_indicator(self, target_index):
@@ -1212,22 +1921,26 @@ class VisualPDFSplitterApp:
             
             # Highlight the target page
             self.set_page_color(target_widget, self.colors['drop_zone'])
-            target_widget['frame'].config(relief=tk.RIDGE, borderwidth=3)
+            self.set_page_border(target_widget, 3, tk.RIDGE)
     
     def clear_drop_highlights(self):
-        """Clear all drop zone highlights"""
-        for i, widget in enumerate(self.page_widgets):
-            if widget is None:
-                continue
-                
-            # Skip the source page (keep it highlighted)
-            if (self.drag_data and i == self.drag_data['source_index']):
-                continue
-                
-            # Reset to normal appearance
-            if not self.is_page_selected(self.page_order[i] + 1):  # Convert to 1-based page number
-                self.set_page_color(widget, self.colors['edit_mode'] if self.edit_mode else self.colors['normal'])
-                widget['frame'].config(relief=tk.RAISED, borderwidth=2)
+        """Clear the drop zone highlight from the current drop target"""
+        if not self.drag_data or self.drag_data['drop_target'] is None:
+            return
+        
+        i = self.drag_data['drop_target']
+        self.drag_data['drop_target'] = None
+        if i >= len(self.page_widgets) or self.page_widgets[i] is None:
+            return
+        widget = self.page_widgets[i]
+            
+        # Reset to normal appearance
+        if not self.is_page_selected(self.page_order[i] + 1):  # Convert to 1-based page number
+            self.set_page_color(widget, self.colors['edit_mode'] if self.edit_mode else self.colors['normal'])
+            self.set_page_border(widget, 2, tk.RAISED)
+        else:
+            # Selected pages get their selection look back
+            self.update_selection_display()
     
     def end_drag(self, event, page_index):
         """End page dragging"""
@@ -1235,14 +1948,26 @@ class VisualPDFSplitterApp:
             return
             
         try:
+            # Drop any motion update still waiting for the next frame
+            if self._drag_motion_after is not None:
+                self.root.after_cancel(self._drag_motion_after)
+                self._drag_motion_after = None
+            
             # Clean up visual elements
-            if self.drag_ghost:
-                self.drag_ghost.destroy()
-                self.drag_ghost = None
+            if self.drag_ghost_visible:
+                self.drag_ghost.withdraw()
+                self.drag_ghost_visible = False
             
             self.root.config(cursor="")
             self.clear_drop_highlights()
             
+            # Reset source page appearance (before a reorder moves the widget)
+            source_widget = self.page_widgets[self.drag_data['source_index']]
+            if source_widget:
+                if not self.is_page_selected(self.drag_data['source_page_num'] + 1):
+                    self.set_page_color(source_widget, self.colors['edit_mode'] if self.edit_mode else self.colors['normal'])
+                self.set_page_border(source_widget, 2, tk.RAISED)
+            
             # If we actually dragged (not just a click)
             if self.drag_data.get('has_moved', False):
                 target_index = self.find_drop_target(event)
@@ -1251,13 +1976,6 @@ class VisualPDFSplitterApp:
                     # Perform the reorder
                     self.reorder_pages(self.drag_data['source_index'], target_index)
             
-            # Reset source page appearance
-            source_widget = self.page_widgets[self.drag_data['source_index']]
-            if source_widget:
-                if not self.is_page_selected(self.drag_data['source_page_num'] + 1):
-                    self.set_page_color(source_widget, self.colors['edit_mode'] if self.edit_mode else self.colors['normal'])
-                source_widget['frame'].config(relief=tk.RAISED, borderwidth=2)
-            
         except Exception as e:
             # Log drag end errors but ensure cleanup still happens
             print(f"Warning: Error ending drag operation: {e}")
@@ -1288,8 +2006,13 @@ class VisualPDFSplitterApp:
             # Mark as edited
             self.has_edited = True
             
-            # Update display
-            self.regenerate_ordered_thumbnails()
+            # Update display - move the existing widgets when the grid mirrors page_order,
+            # otherwise rebuild it
+            if len(self.page_widgets) == len(self.page_order) and self._layout:
+                self.page_widgets.insert(target_index, self.page_widgets.pop(source_index))
+                self.reflow_pages(min(source_index, target_index), max(source_index, target_index))
+            else:
+                self.display_thumbnails(force_rebuild=True)
             self.update_edit_status()
             
             # Update status
@@ -1299,29 +2022,26 @@ class VisualPDFSplitterApp:
             pass
             messagebox.showerror("Reorder Error", f"Failed to reorder pages: {str(e)}")
     
-    def regenerate_ordered_thumbnails(self):
-        """Refresh the thumbnail display after reorder/delete operations"""
-        if not self.pdf_document or not self.page_order:
-            return
-            
-        try:
-            # Just refresh the display - thumbnails stay indexed by original page numbers
-            # The display logic in display_thumbnails() now handles the correct ordering
-            self.display_thumbnails(force_rebuild=True)
-            
-            # Update edit status
-            self.update_edit_status()
-            
-        except Exception as e:
-            # Log regeneration errors and provide fallback
-            print(f"Warning: Error regenerating thumbnails: {e}")
-            self.status_var.set("Warning: Thumbnail regeneration had issues")
-            # Simple fallback: just try to display what we have
-            try:
-                self.display_thumbnails(force_rebuild=True)
-            except Exception as e2:
-                print(f"Error: Even fallback thumbnail display failed: {e2}")
-                self.status_var.set("Error: Unable to display thumbnails")
+    def reflow_pages(self, start_index, end_index):
+        """Move the page widgets in display positions start_index..end_index to their grid cells
+
+        Only the frames between the old and new position change cells, so they are
+        re-gridded and relabelled in place instead of rebuilding the whole grid.
+        """
+        cols = self._layout[1]
+        with self.frozen_layout():
+            for position in range(start_index, end_index + 1):
+                self._grid_entries[position] = (position, self.page_order[position])
+                widget = self.page_widgets[position]
+                if widget is None:
+                    continue  # Not built - realised with its new position when scrolled to
+                widget['frame'].grid_configure(row=position // cols, column=position % cols)
+                widget['display_position'] = position
+                widget['slot'] = position
+                widget['page_label'].config(text=self.page_label_text(position, widget['page_num']))
+        
+        # Pages that moved into view may still need rendering
+        self.schedule_visible_renders()
     
     def reset_edit_session(self):
         """Reset pages to original order, restore deleted pages, and reset rotations"""
@@ -1351,8 +2071,8 @@ class VisualPDFSplitterApp:
                 # Reset rotations to original state
                 self.page_rotations = self.original_rotations.copy()
                 
-                # Regenerate thumbnails in original order and state
-                self.regenerate_ordered_thumbnails()
+                # Redisplay thumbnails in original order and state
+                self.display_thumbnails(force_rebuild=True)
                 self.update_edit_status()
                 
                 self.status_var.set("Edit session reset - all changes undone")
@@ -1412,38 +2132,14 @@ class VisualPDFSplitterApp:
             
         try:
             self.status_var.set("Saving edited PDF...")
-            self.root.update()
+            self.root.update_idletasks()
             
-            # Create new PDF with edited pages (only non-deleted pages in current order)
-            with open(self.pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                pdf_writer = PyPDF2.PdfWriter()
-                
-                # Add pages in the new order, skipping deleted pages
-                for page_index in self.page_order:
-                    # Skip if this page was deleted
-                    if page_index in self.deleted_pages:
-                        continue
-                        
-                    if page_index < len(pdf_reader.pages):
-                        page = pdf_reader.pages[page_index]
-                        
-                        # Apply rotation if set for this page (1-based)
-                        page_number_1based = page_index + 1
-                        if page_number_1based in self.page_rotations:
-                            rotation_angle = self.page_rotations[page_number_1based]
-                            if rotation_angle == 90:
-                                page = page.rotate(90)
-                            elif rotation_angle == 180:
-                                page = page.rotate(180)
-                            elif rotation_angle == 270:
-                                page = page.rotate(270)
-                        
-                        pdf_writer.add_page(page)
-                
-                # Write to file
-                with open(save_path, 'wb') as output_file:
-                    pdf_writer.write(output_file)
+            # Serialise before writing so the source file can safely be overwritten
+            pdf_data = self.edited_pdf_bytes()
+            
+            # Write to file
+            with open(save_path, 'wb') as output_file:
+                output_file.write(pdf_data)
             
             # Show success message with details
             saved_pages = len(self.page_order) - len(self.deleted_pages)
@@ -1472,13 +2168,29 @@ class VisualPDFSplitterApp:
             self.status_var.set("Error saving edited PDF")
 
     def on_crop_canvas_configure(self, event):
-        """Handle crop canvas resize"""
-        canvas_width = event.width
-        self.crop_canvas.itemconfig(self.crop_canvas_window, width=canvas_width)
+        """Handle crop canvas resize - the rows are drawn to the canvas width"""
+        if event.width != self._crop_canvas_width:
+            self._crop_canvas_width = event.width
+            self.update_crop_display()
+        
+    def on_global_mousewheel(self, event):
+        """Send a mouse wheel event to the scroll area under the pointer"""
+        try:
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Pointer is over a Tk-internal widget (e.g. a combobox dropdown)
+            return
+        
+        # Scrollbars handle the wheel themselves
+        if widget is None or widget.winfo_class() in ('Scrollbar', 'TScrollbar'):
+            return
         
-    def on_crop_frame_configure(self, event):
-        """Handle crop thumbnails frame resize"""
-        self.crop_canvas.configure(scrollregion=self.crop_canvas.bbox("all"))
+        while widget is not None:
+            for area, handler in self.wheel_scroll_areas:
+                if widget is area:
+                    handler(event)
+                    return
+            widget = widget.master
         
     def on_crop_mousewheel(self, event):
         """Handle mouse wheel scrolling for crop canvas"""
@@ -1504,10 +2216,10 @@ class VisualPDFSplitterApp:
             
         try:
             # Find all PDF files in the folder (case-insensitive, no duplicates)
-            pdf_files = []
-            for filename in os.listdir(folder_path):
-                if filename.lower().endswith('.pdf'):
-                    pdf_files.append(os.path.join(folder_path, filename))
+            # scandir entries carry their file type, so directories are skipped without a stat
+            with os.scandir(folder_path) as entries:
+                pdf_files = [entry.path for entry in entries
+                             if entry.name.lower().endswith('.pdf') and entry.is_file()]
             
             if not pdf_files:
                 messagebox.showwarning("Warning", "No PDF files found in the selected folder.")
@@ -1517,12 +2229,12 @@ class VisualPDFSplitterApp:
             pdf_files.sort()
             
             self.status_var.set(f"Loading {len(pdf_files)} PDF files...")
-            self.root.update()
+            self.root.update_idletasks()
             
             # Store PDF list and reset index
             self.pdf_list = pdf_files
             self.current_pdf_index = 0
-            self.pdf_documents.clear()  # Clear document cache
+            self.close_documents()  # Clear document cache
             
             # Clear previous selections
             self.clear_selection()
@@ -1546,12 +2258,12 @@ class VisualPDFSplitterApp:
             
         current_pdf_path = self.pdf_list[self.current_pdf_index]
         
+        # Keep the outgoing PDF's thumbnails in case the user comes straight back
+        self.stash_thumbnails()
+        
         try:
-            # Check if PDF is already cached
-            if current_pdf_path not in self.pdf_documents:
-                self.pdf_documents[current_pdf_path] = fitz.open(current_pdf_path)
-            
-            self.pdf_document = self.pdf_documents[current_pdf_path]
+            # Reuse the document if it is still open
+            self.pdf_document = self.get_document(current_pdf_path)
             self.pdf_path = current_pdf_path
             
             if len(self.pdf_document) == 0:
@@ -1575,9 +2287,12 @@ class VisualPDFSplitterApp:
             # Update navigation label
             self.update_pdf_navigation_label()
             
+            # Neighbours are prefetched once this PDF's visible pages have rendered
+            self._prefetch_gen += 1
+            
             # Generate thumbnails in background thread
             self.status_var.set("Generating thumbnails...")
-            threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+            self.generate_thumbnails()
             
             # Ensure root window has focus for keyboard events
             self.root.focus_set()
@@ -1585,6 +2300,38 @@ class VisualPDFSplitterApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load PDF '{os.path.basename(current_pdf_path)}':\n{str(e)}")
             
+    def get_document(self, pdf_path):
+        """Return an open document for a PDF path, reusing recently opened ones
+
+        Documents are kept in LRU order and the oldest are closed once more than
+        MAX_OPEN_DOCUMENTS are open. Session edits are preserved because evicted
+        documents are reopened from their modified temp file.
+        """
+        document = self.pdf_documents.get(pdf_path)
+        if document is not None:
+            self.pdf_documents.move_to_end(pdf_path)
+            return document
+
+        document = fitz.open(self.get_actual_pdf_path(pdf_path))
+        self.pdf_documents[pdf_path] = document
+
+        for cached_path in list(self.pdf_documents):
+            if len(self.pdf_documents) <= self.MAX_OPEN_DOCUMENTS:
+                break
+            # Never close the document currently on screen
+            if self.pdf_documents[cached_path] is self.pdf_document:
+                continue
+            self.pdf_documents.pop(cached_path).close()
+
+        return document
+
+    def close_documents(self):
+        """Close all cached documents except the one currently on screen"""
+        for cached_document in self.pdf_documents.values():
+            if cached_document is not self.pdf_document:
+                cached_document.close()
+        self.pdf_documents.clear()
+
     def update_pdf_navigation_label(self):
         """Update the PDF navigation label"""
         if len(self.pdf_list) <= 1:
@@ -1674,8 +2421,8 @@ class VisualPDFSplitterApp:
             else:
                 return
         
-        # Calculate new zoom level with 15% increments
-        current_zoom = self.thumbnail_size
+        # Calculate new zoom level with 15% increments (from any zoom still being debounced)
+        current_zoom = self.pending_zoom_size
         zoom_increment = max(1, int(current_zoom * 0.15))  # 15% of current zoom, minimum 1 pixel
         
         if zoom_delta > 0:
@@ -1702,16 +2449,15 @@ class VisualPDFSplitterApp:
             
         try:
             self.status_var.set("Loading PDF...")
-            self.root.update()
+            self.root.update_idletasks()
             
             # Reset to single PDF mode
             self.pdf_list = [file_path]
             self.current_pdf_index = 0
-            self.pdf_documents.clear()
+            self.close_documents()
             
             # Load PDF with PyMuPDF
-            self.pdf_document = fitz.open(file_path)
-            self.pdf_documents[file_path] = self.pdf_document
+            self.pdf_document = self.get_document(file_path)
             
             if len(self.pdf_document) == 0:
                 messagebox.showerror("Error", "PDF appears to be empty.")
@@ -1747,85 +2493,430 @@ class VisualPDFSplitterApp:
             
             # Generate thumbnails in background thread
             self.status_var.set("Generating thumbnails...")
-            threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+            self.generate_thumbnails()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load PDF:\n{str(e)}")
             self.status_var.set("Error loading PDF")
             
     def generate_thumbnails(self):
-        """Generate thumbnail images for all pages"""
+        """Show placeholders for all pages and render the visible ones on demand"""
         try:
+            # Queued renders belong to the previous document/zoom state
+            self.cancel_pending_renders()
+
             # Clear thumbnails but preserve order by using a list with proper indexing
             total_pages = len(self.pdf_document)
-            self.page_thumbnails = [None] * total_pages  # Pre-allocate list with correct size
-            
-            
-            # Show progress
-            self.root.after(0, lambda: self.progress_bar.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(10, 0)))
-            
-            # Process pages in order and store at correct index
-            for page_num in range(total_pages):
-                # Update progress
-                progress = (page_num / total_pages) * 100
-                self.root.after(0, lambda p=progress: self.progress_var.set(p))
-                self.root.after(0, lambda p=page_num+1, t=total_pages: 
-                               self.status_var.set(f"Generating thumbnails... {p}/{t}"))
-                
-                # Render page at current zoom level
-                page = self.pdf_document[page_num]
-                
-                # Calculate zoom factor to fit thumbnail size
-                page_rect = page.rect
-                zoom = self.thumbnail_size / max(page_rect.width, page_rect.height)
-                mat = fitz.Matrix(zoom, zoom)
-                
-                # Apply rotation if set for this page
-                page_number = page_num + 1
-                if page_number in self.page_rotations:
-                    rotation_angle = self.page_rotations[page_number]
-                    mat = mat * fitz.Matrix(rotation_angle)
-                
-                # Render page
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("ppm")
-                
-                # Create PIL image and convert to PhotoImage
-                img = Image.open(io.BytesIO(img_data))
-                photo = ImageTk.PhotoImage(img)
-                
-                # Store at correct index to maintain order
-                self.page_thumbnails[page_num] = photo
-                
-            # Verify thumbnails were created (allow some failures)
-            failed_count = self.page_thumbnails.count(None)
-            if failed_count > 0:
-                pass
-                
-            # Update UI on main thread
-            self.root.after(0, lambda: self.display_thumbnails(force_rebuild=True))
-            self.root.after(0, lambda: self.progress_bar.grid_remove())
-            
-            # Set status based on success/failure rate
-            success_count = total_pages - failed_count
-            if failed_count == 0:
-                self.root.after(0, lambda: self.status_var.set(f"Ready - {success_count} pages loaded"))
+            recent = self.recent_thumbnails.pop(self.thumbnail_set_key(), None)
+            if recent is not None and len(recent[0]) == total_pages:
+                # Recently viewed at this zoom - show its thumbnails again without rendering
+                self.page_thumbnails, self.live_thumbnails = recent
             else:
-                self.root.after(0, lambda: self.status_var.set(f"Ready - {success_count}/{total_pages} pages loaded"))
-            
+                self.page_thumbnails = [None] * total_pages  # None = not rendered yet
+                self.live_thumbnails = OrderedDict()
+            self.failed_thumbnails = set()
+
+            # Lay out placeholders now; display_thumbnails() queues the visible pages
+            self.display_thumbnails(force_rebuild=True)
+            self.status_var.set(f"Ready - {total_pages} pages loaded")
+
         except Exception as e:
-            # Log error to console but don't show popup
-            pass
-            self.root.after(0, lambda: self.status_var.set("Error generating thumbnails - check console"))
-            self.root.after(0, lambda: self.progress_bar.grid_remove())
-            
+            print(f"Warning: Error generating thumbnails: {e}")
+            self.status_var.set("Error generating thumbnails - check console")
+
+    def thumbnail_set_key(self):
+        """Identify the current document's thumbnails; the mtime catches files changed on disk"""
+        source_path = self.pdf_document.name
+        try:
+            mtime = os.path.getmtime(source_path)
+        except OSError:
+            mtime = None
+        return (source_path, mtime, self.thumbnail_size)
+
+    def stash_thumbnails(self):
+        """Remember the current PDF's rendered thumbnails before switching to another PDF"""
+        # Thumbnails with edit rotations baked in would be wrong once the rotations are reset
+        if not self.pdf_document or not self.page_thumbnails or self.page_rotations:
+            return
+        
+        key = self.thumbnail_set_key()
+        self.recent_thumbnails[key] = (self.page_thumbnails, self.live_thumbnails)
+        self.recent_thumbnails.move_to_end(key)
+        while len(self.recent_thumbnails) > self.MAX_CACHED_PDFS:
+            self.recent_thumbnails.popitem(last=False)
+
+    def get_render_pool(self):
+        """Return the shared render process pool, creating it on first use"""
+        if self._render_pool is None:
+            # 'spawn' avoids forking a process that owns Tk
+            self._render_pool = ProcessPoolExecutor(max_workers=self.render_worker_count(),
+                                                    mp_context=multiprocessing.get_context('spawn'))
+        return self._render_pool
+
+    def render_worker_count(self):
+        """Number of render worker processes - one core is left for the Tk thread"""
+        return max(1, (os.cpu_count() or 2) - 1)
+
+    def warm_up_render_pool(self):
+        """Start every render worker now so the first visible pages don't wait for process spawn
+
+        Spawned workers re-import this module (Tk, Pillow, PyMuPDF) before they can
+        render, which is far slower than rasterising a thumbnail.
+        """
+        try:
+            pool = self.get_render_pool()
+            for _ in range(self.render_worker_count()):
+                pool.submit(_warm_up_worker)
+        except Exception as e:
+            print(f"Warning: Could not start render workers: {e}")
+
+    def shutdown_render_pool(self):
+        """Stop the render pool worker processes"""
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=False, cancel_futures=True)
+            self._render_pool = None
+            self._inflight.clear()
+
+    def get_placeholder_thumbnail(self):
+        """Return the shared grey PhotoImage shown until a page thumbnail is rendered
+
+        Only the current size is kept: zooming re-points every shown placeholder, so
+        the ones for earlier sizes would only pile up while dragging the zoom slider.
+        """
+        size = self.thumbnail_size
+        if self.placeholder_thumbnail is None or self.placeholder_thumbnail[0] != size:
+            placeholder = Image.new('RGB', (size, size), '#d9d9d9')
+            self.placeholder_thumbnail = (size, ImageTk.PhotoImage(placeholder))
+        return self.placeholder_thumbnail[1]
+
+    def cancel_pending_renders(self):
+        """Drop queued renders and cancel pool renders that have not started yet
+
+        Renders already running are left to finish so their result still lands in the
+        disk cache; they stay registered so an identical request is not submitted twice.
+        """
+        self.render_queue.clear()
+        for key, future in list(self._inflight.items()):
+            if future.cancel():
+                del self._inflight[key]
+
+    def render_key(self, page_index):
+        """Identify a render of a page of the current document at the current zoom"""
+        return (self.pdf_document.name, page_index, self.thumbnail_size)
+
+    def schedule_visible_renders(self, *args):
+        """Coalesce scroll/resize notifications into a single visible-page render pass"""
+        if self._visible_render_after is None:
+            self._visible_render_after = self.root.after(10, self.queue_visible_renders)
+
+    def queue_visible_renders(self):
+        """Queue renders for unrendered pages on screen, then those within one screen of it"""
+        self._visible_render_after = None
+        if not self.pdf_document or not self.page_thumbnails or not self.page_widgets:
+            return
+
+        # Build widgets for pages scrolled into view (and drop the far away ones)
+        self.refresh_visible_widgets()
+        if not self._row_pitch:
+            return
+
+        view_top = self.canvas.canvasy(0)
+        view_height = self.canvas.winfo_height()
+        view_bottom = view_top + view_height
+
+        # Rows are equally tall, so page positions follow from their grid slot
+        cols = self._layout[1]
+        screen_rows = -(-view_height // self._row_pitch)
+        first, last = self.visible_slot_range(screen_rows)
+
+        visible_pages = []
+        nearby_pages = []
+        self.visible_pages = set()
+        for slot in range(first, last):
+            page_index = self._grid_entries[slot][1]
+            frame_top = (slot // cols) * self._row_pitch
+            frame_bottom = frame_top + self._row_pitch
+            on_screen = frame_bottom >= view_top and frame_top <= view_bottom
+            if on_screen:
+                self.visible_pages.add(page_index)
+
+            if self.page_thumbnails[page_index] is not None:
+                if on_screen and page_index in self.live_thumbnails:
+                    self.live_thumbnails.move_to_end(page_index)
+                continue
+            if page_index in self.failed_thumbnails or self.render_key(page_index) in self._inflight:
+                continue
+
+            if on_screen:
+                visible_pages.append(page_index)
+            elif frame_bottom >= view_top - view_height and frame_top <= view_bottom + view_height:
+                # Distance from the viewport, so the pages next to the screen edge render first
+                distance = view_top - frame_bottom if frame_bottom < view_top else frame_top - view_bottom
+                nearby_pages.append((distance, page_index))
+
+        # The latest view wins: pages scrolled away from are dropped from the queue
+        nearby_pages.sort()
+        self.render_queue = deque(visible_pages + [page_index for _, page_index in nearby_pages])
+        self.process_render_queue()
+
+    def process_render_queue(self):
+        """Serve queued pages from the disk cache or submit them to the render pool"""
+        if not self.pdf_document:
+            return
+        source_path = self.pdf_document.name
+        page_count = len(self.pdf_document)
+        size = self.thumbnail_size
+
+        max_inflight = max(self.MAX_INFLIGHT_RENDERS, 2 * self.render_worker_count())
+        cache_loads = 0
+        while self.render_queue and len(self._inflight) < max_inflight:
+            if cache_loads >= self.MAX_CACHE_LOADS_PER_PASS:
+                # Cached pages are decoded here, so let Tk handle input before loading more
+                if self._render_queue_after is None:
+                    self._render_queue_after = self.root.after_idle(self.resume_render_queue)
+                return
+            page_index = self.render_queue.popleft()
+            key = (source_path, page_index, size)
+            # Coalesce identical requests: already shown, or the same render is in flight
+            if self.page_thumbnails[page_index] is not None or key in self._inflight:
+                continue
+
+            img = self.thumbnail_cache.get(source_path, page_count, page_index, size)
+            if img is not None:
+                self.install_page_thumbnail(page_index, img)
+                cache_loads += 1
+                continue
+
+            try:
+                future = self.get_render_pool().submit(_render_page, source_path, page_index, size)
+            except Exception as e:
+                # No worker processes available - render this page in-process instead
+                print(f"Warning: Render pool unavailable, rendering in-process: {e}")
+                self.shutdown_render_pool()
+                self.render_page_in_process(page_index)
+                continue
+
+            self._inflight[key] = future
+            future.add_done_callback(lambda f, k=key: self.on_render_done(f, k, page_count))
+
+        if not self.render_queue and not self._inflight:
+            if self._prefetched_gen != self._prefetch_gen:
+                # Visible pages are done - warm the neighbouring PDFs while the user reads
+                self._prefetched_gen = self._prefetch_gen
+                self.root.after_idle(self.prefetch_neighbour_pdfs, self._prefetch_gen)
+            elif self._evicted_gen != self._prefetch_gen:
+                # Idle again - trim the disk cache off the Tk thread, once per document
+                self._evicted_gen = self._prefetch_gen
+                threading.Thread(target=self.thumbnail_cache.evict, daemon=True).start()
+
+    def resume_render_queue(self):
+        """Continue a queue pass that stopped after MAX_CACHE_LOADS_PER_PASS cache hits"""
+        self._render_queue_after = None
+        self.process_render_queue()
+
+    def prefetch_neighbour_pdfs(self, generation):
+        """Open the previous/next PDF in the folder and render their leading pages into the disk cache
+
+        Prefetch renders are registered as in-flight, so navigating to a neighbour picks
+        them up instead of submitting the same pages again, and switching PDF cancels
+        any that have not started yet.
+        """
+        if generation != self._prefetch_gen or len(self.pdf_list) <= 1:
+            return
+
+        size = self.thumbnail_size
+        for offset in (1, -1):
+            neighbour_path = self.pdf_list[(self.current_pdf_index + offset) % len(self.pdf_list)]
+            try:
+                document = self.get_document(neighbour_path)
+            except Exception as e:
+                print(f"Warning: Could not prefetch {os.path.basename(neighbour_path)}: {e}")
+                continue
+            source_path = document.name
+            page_count = len(document)
+
+            for page_index in range(min(self.PREFETCH_PAGES, page_count)):
+                key = (source_path, page_index, size)
+                if key in self._inflight or self.thumbnail_cache.contains(source_path, page_count,
+                                                                          page_index, size):
+                    continue
+                try:
+                    future = self.get_render_pool().submit(_render_page, source_path, page_index, size)
+                except Exception as e:
+                    print(f"Warning: Render pool unavailable, skipping prefetch: {e}")
+                    self.shutdown_render_pool()
+                    return
+                self._inflight[key] = future
+                future.add_done_callback(lambda f, k=key, n=page_count: self.on_render_done(f, k, n))
+
+    def on_render_done(self, future, key, page_count):
+        """Decode and cache a finished render (pool callback thread), then hand it to the Tk thread"""
+        if future.cancelled():
+            return
+        source_path, page_index, size = key
+        try:
+            img = Image.open(io.BytesIO(future.result()))
+            img.load()
+            self.thumbnail_cache.put(source_path, page_count, page_index, size, img)
+        except Exception as e:
+            print(f"Warning: Render worker failed for page {page_index + 1}: {e}")
+            img = None
+        self.root.after(0, lambda: self.finish_page_render(key, future, img))
+
+    def finish_page_render(self, key, future, img):
+        """Install a finished render if it still matches what is displayed, and keep the queue moving"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+        # Renders for another document or zoom level were only needed for the disk cache
+        source_path, page_index, size = key
+        if (self.pdf_document is not None and source_path == self.pdf_document.name and
+                size == self.thumbnail_size and page_index < len(self.page_thumbnails) and
+                self.page_thumbnails[page_index] is None):
+            if img is None:
+                self.render_page_in_process(page_index)
+            else:
+                self.install_page_thumbnail(page_index, img, ppm_data=future.result())
+
+        self.process_render_queue()
+
+    def render_page_in_process(self, page_index):
+        """Render a page thumbnail on the Tk thread, marking it failed if that fails too"""
+        try:
+            img = self.render_thumbnail_image(page_index, apply_rotation=False)
+            self.install_page_thumbnail(page_index, img)
+        except Exception as e:
+            print(f"Warning: Failed to render thumbnail for page {page_index + 1}: {e}")
+            self.failed_thumbnails.add(page_index)
+
+    def install_page_thumbnail(self, page_index, img, ppm_data=None):
+        """Convert a rendered (unrotated) image into a PhotoImage and show it in place
+
+        When the raw PPM bytes of a fresh render are available and the page is not
+        rotated, Tk decodes them directly instead of copying through Pillow.
+        """
+        if ppm_data is not None and not self.page_rotations.get(page_index + 1, 0):
+            photo = tk.PhotoImage(data=ppm_data)
+        else:
+            photo = ImageTk.PhotoImage(self.apply_thumbnail_rotation(page_index, img))
+        self.page_thumbnails[page_index] = photo
+        img.close()
+
+        widget = self.get_page_widget(page_index + 1)
+        if widget is not None:
+            widget['thumb_label'].config(image=photo)
+            widget['preview'] = None
+
+        self.live_thumbnails[page_index] = None
+        self.live_thumbnails.move_to_end(page_index)
+        self.release_offscreen_thumbnails()
+
+    def release_offscreen_thumbnails(self):
+        """Drop the least recently seen off-screen PhotoImages beyond the in-memory budget
+
+        Released pages show the placeholder again and are re-rendered from the disk
+        cache when they scroll back into view.
+        """
+        limit = max(self.MIN_LIVE_THUMBNAILS, len(self.visible_pages) * 3)
+        if len(self.live_thumbnails) <= limit:
+            return
+
+        placeholder = self.get_placeholder_thumbnail()
+        for page_index in list(self.live_thumbnails):
+            if len(self.live_thumbnails) <= limit:
+                break
+            if page_index in self.visible_pages:
+                continue
+            del self.live_thumbnails[page_index]
+            self.page_thumbnails[page_index] = None
+            widget = self.get_page_widget(page_index + 1)
+            if widget is not None:
+                widget['thumb_label'].config(image=placeholder)
+
+    def apply_thumbnail_rotation(self, page_index, img):
+        """Rotate an unrotated thumbnail image by the page's current edit rotation"""
+        rotation = self.page_rotations.get(page_index + 1, 0)
+        # Quarter-turn rotations are lossless pixel transposes (negative = clockwise, like prerotate)
+        if rotation:
+            img = img.rotate(-rotation, expand=True)
+        return img
+
+    def thumbnail_matrix(self, page_rect):
+        """Return the matrix mapping a page to thumbnail pixels (longest side = thumbnail size)
+
+        Most documents use one or two page sizes, so the matrices are built once and reused.
+        """
+        size = self.thumbnail_size
+        key = (page_rect.width, page_rect.height, size)
+        mat = self._thumbnail_matrices.get(key)
+        if mat is None:
+            if len(self._thumbnail_matrices) >= 256:
+                self._thumbnail_matrices.clear()
+            zoom = _thumbnail_zoom(page_rect, size)
+            mat = self._thumbnail_matrices[key] = fitz.Matrix(zoom, zoom)
+        return mat
+
+    def render_thumbnail_image(self, page_index, apply_rotation=True):
+        """Render a page thumbnail as a PIL image at exactly the displayed size
+
+        Pages are rasterised unrotated so every zoom level and rotation can be served
+        from the disk cache; a cached render at least as large as the requested size
+        is shrunk instead of re-rasterising the page.
+        """
+        source_path = self.pdf_document.name
+        page_count = len(self.pdf_document)
+
+        img = self.thumbnail_cache.get(source_path, page_count, page_index, self.thumbnail_size)
+        if img is None:
+            page = self.pdf_document[page_index]
+
+            # Render page and copy the raw RGB samples once, straight from MuPDF's buffer
+            # (samples_mv does not keep the pixmap alive, so the image must own its pixels)
+            pix = page.get_pixmap(matrix=self.thumbnail_matrix(page.rect), alpha=False)
+            img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", 0, 1).copy()
+
+            self.thumbnail_cache.put(source_path, page_count, page_index, self.thumbnail_size, img)
+
+        if apply_rotation:
+            img = self.apply_thumbnail_rotation(page_index, img)
+
+        return img
+
+    def grid_layout(self, canvas_width):
+        """Return (margin, columns, thumbnail cell width) for the current view mode"""
+        margin = 15 if self.view_mode == 'single' else 10
+        
+        if self.view_mode == 'single':
+            # Single page mode - force 1 column, larger spacing
+            cols = 1
+            thumb_width = min(self.thumbnail_size, canvas_width - 2 * margin)
+        else:
+            # Grid mode - calculate columns based on thumbnail size
+            thumb_width = self.thumbnail_size + 60  # Add more padding for rotation buttons
+            cols = max(1, (canvas_width - margin) // (thumb_width + margin))
+        
+        return margin, cols, thumb_width
+
     def display_thumbnails(self, force_rebuild=False):
         """Display thumbnail images in the canvas"""
+        # Clear, rebuild and lay out the grid while the frame is hidden so Tk draws it once
+        with self.frozen_layout():
+            self.build_thumbnail_grid(force_rebuild)
+
+        # Render the pages that are now on screen
+        self.schedule_visible_renders()
+
+    def build_thumbnail_grid(self, force_rebuild):
+        """Create the page widgets for the current page order (see display_thumbnails)"""
         # Clear existing thumbnails if force_rebuild or first time
         if force_rebuild or not hasattr(self, '_thumbnails_displayed'):
             for widget in self.thumbnails_frame.winfo_children():
                 widget.destroy()
             self.page_widgets.clear()
+            self.page_widgets_by_num.clear()
+            self.page_widget_of.clear()
+            self._grid_entries = []
+            self._widget_pool = []
             self._thumbnails_displayed = False
         
         if not self.page_thumbnails:
@@ -1837,199 +2928,287 @@ class VisualPDFSplitterApp:
             self.root.after(100, self.display_thumbnails)  # Retry when canvas is ready
             return
             
-        margin = 15 if self.view_mode == 'single' else 10
-        
-        if self.view_mode == 'single':
-            # Single page mode - force 1 column, larger spacing
-            cols = 1
-            thumb_width = min(self.thumbnail_size, canvas_width - 2 * margin)
-        else:
-            # Grid mode - calculate columns based on thumbnail size
-            thumb_width = self.thumbnail_size + 60  # Add more padding for rotation buttons
-            cols = max(1, (canvas_width - margin) // (thumb_width + margin))
+        margin, cols, thumb_width = self.grid_layout(canvas_width)
+        self._layout = (margin, cols, thumb_width)
         
         # Create thumbnail grid - display pages in current order, excluding deleted pages
-        displayed_count = 0
+        self._grid_entries = [(display_position, original_page_index)
+                              for display_position, original_page_index in enumerate(self.page_order)
+                              # Skip deleted pages, invalid indices and thumbnails that failed to generate
+                              if original_page_index not in self.deleted_pages
+                              and original_page_index < len(self.page_thumbnails)
+                              and original_page_index not in self.failed_thumbnails]
         
-        for display_position, original_page_index in enumerate(self.page_order):
-            # Skip deleted pages
-            if original_page_index in self.deleted_pages:
-                continue
-            
-            # Validate page index
-            if original_page_index >= len(self.page_thumbnails):
-                continue
-                
-            # Get the thumbnail for this original page
-            photo = self.page_thumbnails[original_page_index]
-            
-            # Skip if thumbnail failed to generate
-            if photo is None:
-                continue
-                
-            # Original page number (1-based for display)
-            original_page_number = original_page_index + 1
-            
-            row = displayed_count // cols
-            col = displayed_count % cols
-            displayed_count += 1
-            
-            # In single page mode, center the thumbnail
-            if self.view_mode == 'single':
-                padx = margin
-                sticky_opts = tk.N
-            else:
-                padx = margin//2
-                sticky_opts = (tk.W, tk.E, tk.N, tk.S)
-            
-            # Create frame for each thumbnail
-            bg_color = self.colors['edit_mode'] if self.edit_mode else self.colors['normal']
-            thumb_frame = tk.Frame(self.thumbnails_frame, relief=tk.RAISED, borderwidth=2,
-                                 bg=bg_color, cursor='hand2')
-            thumb_frame.grid(row=row, column=col, padx=padx, pady=margin//2, 
-                           sticky=sticky_opts)
-            
-            # Page number and rotation info
-            rotation_angle = self.page_rotations.get(original_page_number, 0)
-            rotation_text = f" (↻{rotation_angle}°)" if rotation_angle != 0 else ""
-            
-            # Show current position in edit mode
-            if self.edit_mode:
-                current_position = displayed_count  # 1-based position in current order
-                page_text = f"#{current_position}: Page {original_page_number}{rotation_text}"
-            else:
-                page_text = f"Page {original_page_number}{rotation_text}"
-            
-            page_label = tk.Label(thumb_frame, text=page_text, 
-                                font=(self.FONT_FAMILY, 11 if self.view_mode == 'single' else 9, 'bold'), 
-                                bg=bg_color)
-            page_label.pack(pady=(8 if self.view_mode == 'single' else 5, 
-                                 2 if self.view_mode == 'single' else 1))
-            
-            # Edit mode controls (rotation and delete)
-            if self.edit_mode:
-                edit_controls_frame = tk.Frame(thumb_frame, bg=bg_color)
-                edit_controls_frame.pack(pady=(0, 4 if self.view_mode == 'single' else 2))
-                
-                # Rotation buttons
-                rotation_frame = tk.Frame(edit_controls_frame, bg=bg_color)
-                rotation_frame.pack(side=tk.LEFT, padx=(0, 5))
-                
-                # Rotate left button
-                rotate_left_btn = tk.Button(rotation_frame, text="↺", 
-                                          font=(self.FONT_FAMILY, 10 if self.view_mode == 'single' else 8, 'bold'),
-                                          width=3 if self.view_mode == 'single' else 2,
-                                          height=1,
-                                          command=lambda p=original_page_number: self.rotate_page(p, -90),
-                                          bg='lightblue', relief=tk.RAISED, cursor='hand2')
-                rotate_left_btn.pack(side=tk.LEFT, padx=(0, 2))
-                
-                # Rotate right button  
-                rotate_right_btn = tk.Button(rotation_frame, text="↻", 
-                                           font=(self.FONT_FAMILY, 10 if self.view_mode == 'single' else 8, 'bold'),
-                                           width=3 if self.view_mode == 'single' else 2,
-                                           height=1,
-                                           command=lambda p=original_page_number: self.rotate_page(p, 90),
-                                           bg='lightgreen', relief=tk.RAISED, cursor='hand2')
-                rotate_right_btn.pack(side=tk.LEFT, padx=(2, 0))
-                
-                # Delete button - use display position to delete from current order
-                delete_btn = tk.Button(edit_controls_frame, text="❌", 
-                                     font=(self.FONT_FAMILY, 10 if self.view_mode == 'single' else 8, 'bold'),
-                                     width=3 if self.view_mode == 'single' else 2,
-                                     height=1,
-                                     command=lambda pos=display_position: self.delete_page(pos),
-                                     bg='lightcoral', relief=tk.RAISED, cursor='hand2')
-                delete_btn.pack(side=tk.RIGHT)
-            else:
-                rotation_frame = None
-                rotate_left_btn = None
-                rotate_right_btn = None
-                delete_btn = None
-            
-            # Thumbnail image
-            thumb_label = tk.Label(thumb_frame, image=photo, bg=bg_color)
-            thumb_label.pack(pady=(4 if self.view_mode == 'single' else 2, 
-                                 4 if self.view_mode == 'single' else 2))
-            
-            # Status label (bottom)
-            status_label = tk.Label(thumb_frame, text="", 
-                                  font=(self.FONT_FAMILY, 10 if self.view_mode == 'single' else 8, 'bold'),
-                                  bg=bg_color, fg='black')
-            status_label.pack(pady=(0, 8 if self.view_mode == 'single' else 5))
-            
-            # Store widget references
-            page_widget = {
-                'frame': thumb_frame,
-                'page_label': page_label,
-                'thumb_label': thumb_label,
-                'status_label': status_label,
-                'rotation_frame': rotation_frame,
-                'rotate_left_btn': rotate_left_btn,
-                'rotate_right_btn': rotate_right_btn,
-                'delete_btn': delete_btn if self.edit_mode else None,
-                'page_num': original_page_number,  # 1-based page number for display
-                'page_index': original_page_index,  # 0-based original page index
-                'display_position': display_position  # Position in current page_order
-            }
-            
-            # Add widget to the list (widgets are now stored in display order)
-            self.page_widgets.append(page_widget)
-            
-            # Setup drag and drop if in edit mode (use display_position for the drag logic)
-            if self.edit_mode:
-                self.setup_drag_and_drop(page_widget, display_position)
-            
-            # Bind click events to main elements (not edit control buttons)
-            clickable_widgets = [thumb_frame, page_label, thumb_label, status_label]
-            if not self.edit_mode:  # Only bind regular clicks if not in edit mode
-                for widget in clickable_widgets:
-                    widget.bind(self.EVENT_BUTTON_1, lambda e, page=original_page_number: self.handle_click(e, page))
-                    widget.bind('<B1-Motion>', lambda e, page=original_page_number: self.handle_drag(e, page))
-                    widget.bind('<ButtonRelease-1>', lambda e, page=original_page_number: self.handle_release(e, page))
-                    widget.bind('<Enter>', lambda e, page=original_page_number: self.on_page_hover(page, True))
-                    widget.bind('<Leave>', lambda e, page=original_page_number: self.on_page_hover(page, False))
-            else:
-                # In edit mode, only bind hover effects to non-drag widgets
-                for widget in clickable_widgets:
-                    widget.bind('<Enter>', lambda e, page=original_page_number: self.on_page_hover(page, True))
-                    widget.bind('<Leave>', lambda e, page=original_page_number: self.on_page_hover(page, False))
-                    
-            # Always bind mouse wheel scrolling
-            for widget in clickable_widgets:
-                widget.bind(self.EVENT_MOUSE_WHEEL, self.on_mousewheel)
-                widget.bind(self.EVENT_BUTTON_4, self.on_mousewheel)  # Linux
-                widget.bind(self.EVENT_BUTTON_5, self.on_mousewheel)  # Linux
+        # Widgets only exist for the rows around the viewport; the other slots stay None
+        self.page_widgets[:] = [None] * len(self._grid_entries)
+        self._widget_pool = []
         
         # Configure grid weights for single page mode
         if self.view_mode == 'single':
             self.thumbnails_frame.columnconfigure(0, weight=1)
         
-        # Update scroll region and canvas size
-        self.thumbnails_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        rows = -(-len(self._grid_entries) // cols)
+        if rows:
+            # Measure one row from the first page; a placeholder-sized thumbnail is the
+            # tallest a page can be, so every row gets that height
+            self._row_pitch = self.measure_row_pitch(self.realise_page_widget(0))
+        
+        # Empty rows keep their height, so the scroll region covers every page
+        for row in range(rows):
+            self.thumbnails_frame.rowconfigure(row, minsize=self._row_pitch)
+        for row in range(rows, self._grid_rows):
+            self.thumbnails_frame.rowconfigure(row, minsize=0)
+        self._grid_rows = rows
         
+        self.refresh_visible_widgets()
+
         # Mark thumbnails as successfully displayed
         self._thumbnails_displayed = True
-        
+
         # Update selection display
         self.update_selection_display_with_validation()
+
+    def measure_row_pitch(self, widget):
+        """Return the grid row height a page widget needs with a full-size thumbnail"""
+        self.thumbnails_frame.update_idletasks()
+        photo = widget['preview'] or self.page_thumbnails[widget['page_index']]
+        image_height = photo.height() if photo is not None else self.thumbnail_size
+        return (widget['frame'].winfo_reqheight() - image_height
+                + self.thumbnail_size + 2 * (self._layout[0] // 2))
+
+    def visible_slot_range(self, extra_rows=0):
+        """Return the grid slots [first, last) shown in the viewport, widened by extra_rows"""
+        cols = self._layout[1]
+        view_top = self.canvas.canvasy(0)
+        first_row = max(0, int(view_top // self._row_pitch) - extra_rows)
+        last_row = int((view_top + self.canvas.winfo_height()) // self._row_pitch) + extra_rows
+        return first_row * cols, min(len(self._grid_entries), (last_row + 1) * cols)
+
+    def refresh_visible_widgets(self):
+        """Build page widgets for the rows around the viewport and recycle the rest
+
+        Only a few screens of widgets exist at any time, so opening and scrolling a
+        long PDF costs the same as a short one.
+        """
+        if not self._grid_entries or not self._row_pitch:
+            return
+        
+        first, last = self.visible_slot_range(self.OVERSCAN_ROWS)
+        for widget in list(self.page_widgets_by_num.values()):
+            if not first <= widget['slot'] < last:
+                self.recycle_page_widget(widget)
+        for slot in range(first, last):
+            if self.page_widgets[slot] is None:
+                self.realise_page_widget(slot)
+
+    def realise_page_widget(self, slot):
+        """Show the page of grid slot `slot`, reusing a hidden widget when one is available"""
+        display_position, original_page_index = self._grid_entries[slot]
+        margin, cols, _ = self._layout
+        if not self._widget_pool:
+            widget = self.create_page_widget(display_position, original_page_index, slot, cols, margin)
+        else:
+            widget = self._widget_pool.pop()
+            widget['page_index'] = original_page_index
+            widget['page_num'] = original_page_index + 1
+            widget['display_position'] = display_position
+            widget['slot'] = slot
+            
+            photo = self.page_thumbnails[original_page_index]
+            widget['thumb_label'].config(image=photo if photo is not None else self.get_placeholder_thumbnail())
+            widget['preview'] = None
+            widget['page_label'].config(text=self.page_label_text(slot, widget['page_num']))
+            widget['frame'].grid(row=slot // cols, column=slot % cols)
+        
+        self.page_widgets[slot] = widget
+        self.page_widgets_by_num[widget['page_num']] = widget
+        self.apply_page_style(widget, self.page_style_name(widget['page_num']))
+        return widget
+
+    def recycle_page_widget(self, widget):
+        """Hide a page widget that scrolled away and keep it for reuse"""
+        widget['frame'].grid_remove()
+        self.page_widgets[widget['slot']] = None
+        del self.page_widgets_by_num[widget['page_num']]
+        self._widget_pool.append(widget)
+
+    def page_label_text(self, slot, original_page_number):
+        """Return the caption for a page shown in grid slot `slot`"""
+        rotation_angle = self.page_rotations.get(original_page_number, 0)
+        rotation_text = f" (↻{rotation_angle}°)" if rotation_angle != 0 else ""
+    
+        # Show current position in edit mode
+        if self.edit_mode:
+            current_position = slot + 1  # 1-based position in current order
+            return f"#{current_position}: Page {original_page_number}{rotation_text}"
+        return f"Page {original_page_number}{rotation_text}"
+
+    def create_page_widget(self, display_position, original_page_index, slot, cols, margin):
+        """Create the widgets for one page in grid slot `slot` of the thumbnail grid"""
+        # Get the thumbnail for this original page (placeholder until it is rendered)
+        photo = self.page_thumbnails[original_page_index]
+        if photo is None:
+            photo = self.get_placeholder_thumbnail()
+        
+        # Original page number (1-based for display)
+        original_page_number = original_page_index + 1
+    
+        row = slot // cols
+        col = slot % cols
+    
+        style = self.PAGE_WIDGET_STYLE[self.view_mode]
+    
+        # In single page mode, center the thumbnail
+        if self.view_mode == 'single':
+            padx = margin
+            sticky_opts = tk.N
+        else:
+            padx = margin//2
+            sticky_opts = (tk.W, tk.E, tk.N, tk.S)
+    
+        # Create frame for each thumbnail
+        bg_color = self.colors['edit_mode'] if self.edit_mode else self.colors['normal']
+        thumb_frame = tk.Frame(self.thumbnails_frame, relief=tk.RAISED, borderwidth=2,
+                             bg=bg_color, cursor='hand2')
+        thumb_frame.grid(row=row, column=col, padx=padx, pady=margin//2, 
+                       sticky=sticky_opts)
+    
+        # Page number and rotation info
+        page_text = self.page_label_text(slot, original_page_number)
+    
+        page_label = tk.Label(thumb_frame, text=page_text, 
+                            font=style['label_font'], bg=bg_color)
+        page_label.pack(pady=style['label_pady'])
+    
+        # Edit mode controls (rotation and delete) - always built, shown by set_edit_controls()
+        edit_controls_frame = tk.Frame(thumb_frame, bg=bg_color)
+        
+        # Rotation buttons
+        rotation_frame = tk.Frame(edit_controls_frame, bg=bg_color)
+        rotation_frame.pack(side=tk.LEFT, padx=(0, 5))
+        
+        # Rotate left button
+        rotate_left_btn = tk.Button(rotation_frame, text="↺", 
+                                  font=style['small_font'],
+                                  width=style['button_width'],
+                                  height=1,
+                                  command=lambda: self.rotate_page(page_widget['page_num'], -90),
+                                  bg='lightblue', relief=tk.RAISED, cursor='hand2')
+        rotate_left_btn.pack(side=tk.LEFT, padx=(0, 2))
+        
+        # Rotate right button  
+        rotate_right_btn = tk.Button(rotation_frame, text="↻", 
+                                   font=style['small_font'],
+                                   width=style['button_width'],
+                                   height=1,
+                                   command=lambda: self.rotate_page(page_widget['page_num'], 90),
+                                   bg='lightgreen', relief=tk.RAISED, cursor='hand2')
+        rotate_right_btn.pack(side=tk.LEFT, padx=(2, 0))
+        
+        # Delete button - use display position to delete from current order
+        delete_btn = tk.Button(edit_controls_frame, text="❌", 
+                             font=style['small_font'],
+                             width=style['button_width'],
+                             height=1,
+                             command=lambda: self.delete_page(page_widget['display_position']),
+                             bg='lightcoral', relief=tk.RAISED, cursor='hand2')
+        delete_btn.pack(side=tk.RIGHT)
+    
+        # Thumbnail image
+        thumb_label = tk.Label(thumb_frame, image=photo, bg=bg_color)
+        thumb_label.pack(pady=style['thumb_pady'])
+    
+        # Status label (bottom)
+        status_label = tk.Label(thumb_frame, text="", 
+                              font=style['small_font'],
+                              bg=bg_color, fg='black')
+        status_label.pack(pady=style['status_pady'])
+    
+        # Store widget references
+        page_widget = {
+            'frame': thumb_frame,
+            'page_label': page_label,
+            'thumb_label': thumb_label,
+            'status_label': status_label,
+            'edit_controls_frame': edit_controls_frame,
+            'rotation_frame': rotation_frame,
+            'rotate_left_btn': rotate_left_btn,
+            'rotate_right_btn': rotate_right_btn,
+            'delete_btn': delete_btn,
+            'page_num': original_page_number,  # 1-based page number for display
+            'page_index': original_page_index,  # 0-based original page index
+            'display_position': display_position,  # Position in current page_order
+            'slot': slot,  # Index in page_widgets / cell of the thumbnail grid
+            'bg': None,  # Background last applied by set_page_color()
+            'border': None,  # (borderwidth, relief) last applied by set_page_border()
+            'status': None,  # (text, fg) last applied to status_label by apply_page_style()
+            'preview': None  # Rescaled stand-in shown while the page renders at a new zoom
+        }
+    
+        # Mouse handling comes from the shared bindtags (see bind_page_events); the
+        # buttons above read the page from page_widget, so reusing the widget needs no rebinding
+        for element in (thumb_frame, page_label, thumb_label, status_label):
+            self.page_widget_of[element] = page_widget
+        self.set_edit_controls(page_widget)
+        
+        return page_widget
+
+    def set_edit_controls(self, page_widget):
+        """Show or hide a page widget's edit controls and switch its mouse handling to match edit mode"""
+        if self.edit_mode:
+            page_widget['edit_controls_frame'].pack(before=page_widget['thumb_label'],
+                                                    pady=self.PAGE_WIDGET_STYLE[self.view_mode]['controls_pady'])
+            # Drag to reorder from the frame and its labels, hover effects everywhere
+            mode_tags = {'frame': ('PageDrag', 'PageHover'), 'page_label': ('PageDrag', 'PageHover'),
+                         'thumb_label': ('PageDrag', 'PageHover'), 'status_label': ('PageHover',)}
+        else:
+            page_widget['edit_controls_frame'].pack_forget()
+            mode_tags = dict.fromkeys(('frame', 'page_label', 'thumb_label', 'status_label'),
+                                      ('PageClick', 'PageHover'))
+        
+        for element, tags in mode_tags.items():
+            widget = page_widget[element]
+            own_tags = tuple(tag for tag in widget.bindtags() if tag not in self.PAGE_EVENT_TAGS)
+            widget.bindtags(tags + own_tags)
+
+    @contextlib.contextmanager
+    def frozen_layout(self):
+        """Hide the thumbnails frame during a bulk rebuild, then lay it out and show it once
+
+        Blocks may nest; only the outermost one hides the frame and redraws on exit.
+        The scrollbar is detached meanwhile, so the intermediate scroll regions of the
+        rebuild neither redraw it nor queue render passes.
+        """
+        self._frozen_depth += 1
+        if self._frozen_depth == 1:
+            self.canvas.itemconfigure(self.canvas_window, state='hidden')
+            yscroll_command = self.canvas.cget('yscrollcommand')
+            self.canvas.configure(yscrollcommand='')
+        try:
+            yield
+        finally:
+            self._frozen_depth -= 1
+            if self._frozen_depth == 0:
+                # Update scroll region and canvas size (hidden items have no bbox, so show first)
+                self.thumbnails_frame.update_idletasks()
+                self.canvas.itemconfigure(self.canvas_window, state='normal')
+                self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+                
+                # Reattach the scrollbar (by Tcl command name, so no new command is created)
+                # and sync it with the final view once
+                self.canvas.configure(yscrollcommand=yscroll_command)
+                self.on_canvas_yscroll(*self.canvas.yview())
         
     def on_page_hover(self, page_num, enter):
         """Handle page hover effects"""
         # Find the widget for this page number in the current display order
-        target_widget = None
-        for widget in self.page_widgets:
-            if widget is not None and widget['page_num'] == page_num:
-                target_widget = widget
-                break
+        target_widget = self.get_page_widget(page_num)
                 
         if not target_widget:
             return
             
         # Don't change color if page is selected, is the current start page, or we're dragging
-        if (self.is_page_selected(page_num) or 
-            page_num == self.current_selection.get('start') or 
+        if (page_num in self.selection_styles() or
             (self.drag_data and not self.drag_data.get('has_moved', False))):
             return
             
@@ -2041,14 +3220,34 @@ class VisualPDFSplitterApp:
             
     def set_page_color(self, widget, color):
         """Set background color for all elements of a page widget"""
-        elements_to_color = ['frame', 'page_label', 'thumb_label', 'status_label']
-        if widget.get('rotation_frame'):
-            elements_to_color.append('rotation_frame')
+        # Hover and drag handlers repaint constantly - skip the Tk calls when nothing changes
+        if widget.get('bg') == color:
+            return
+        widget['bg'] = color
+        
+        elements_to_color = ['frame', 'page_label', 'thumb_label', 'status_label',
+                             'edit_controls_frame', 'rotation_frame']
             
         for element in elements_to_color:
             if element in widget and widget[element]:
                 widget[element].config(bg=color)
             
+    def set_page_border(self, widget, borderwidth, relief):
+        """Set the frame border of a page widget, skipping the Tk call when unchanged"""
+        if widget.get('border') == (borderwidth, relief):
+            return
+        widget['border'] = (borderwidth, relief)
+        widget['frame'].config(borderwidth=borderwidth, relief=relief)
+            
+    def apply_page_style(self, widget, style_name):
+        """Apply a named selection style from self.page_styles to a page widget"""
+        color_key, status_text, status_fg, borderwidth, relief = self.page_styles[style_name]
+        self.set_page_color(widget, self.colors[color_key])
+        if widget.get('status') != (status_text, status_fg):
+            widget['status'] = (status_text, status_fg)
+            widget['status_label'].config(text=status_text, fg=status_fg)
+        self.set_page_border(widget, borderwidth, relief)
+            
     def validate_state(self):
         """Validate internal state consistency"""
         try:
@@ -2073,10 +3272,9 @@ class VisualPDFSplitterApp:
                 return False
                 
             # Validate page_widgets consistency
-            if self.page_widgets:
-                for i, widget in enumerate(self.page_widgets):
-                    if widget is not None and 'page_num' not in widget:
-                        return False
+            for widget in self.page_widgets_by_num.values():
+                if 'page_num' not in widget:
+                    return False
                         
             return True
         except Exception:
@@ -2194,75 +3392,48 @@ class VisualPDFSplitterApp:
         
         self.update_selection_display()
         
-    def update_selection_display(self):
-        """Update visual selection indicators"""
-        if not self.page_widgets:
-            return
-            
-        # Reset all pages to normal
-        for widget in self.page_widgets:
-            if widget is None:  # Skip failed thumbnails
-                continue
-                
-            page_num = widget['page_num']
-            
-            if not self.is_page_selected(page_num):
-                bg_color = self.colors['edit_mode'] if self.edit_mode else self.colors['normal']
-                self.set_page_color(widget, bg_color)
-                widget['status_label'].config(text="", fg='black')
-                widget['frame'].config(borderwidth=2, relief=tk.RAISED)
-            
-        # Show current selection start
-        if self.current_selection['start']:
-            # Find widget for start page
-            start_widget = None
-            for widget in self.page_widgets:
-                if widget is not None and widget['page_num'] == self.current_selection['start']:
-                    start_widget = widget
-                    break
-                    
-            if start_widget:
-                self.set_page_color(start_widget, self.colors['start'])
-                start_widget['status_label'].config(text="START", fg='darkgreen')
-                start_widget['frame'].config(borderwidth=3, relief=tk.SOLID)
-            
-        # Show completed ranges
+    def page_style_name(self, page_num):
+        """Return the page_styles entry update_selection_display() gives a page"""
+        return self.selection_styles().get(page_num, 'edit_mode' if self.edit_mode else 'normal')
+
+    def selection_styles(self):
+        """Return {page_num: style name} for the selected pages of the current PDF
+
+        Built once per selection state, so styling W pages costs O(W) lookups
+        instead of walking every range for every page.
+        """
+        key = (self.pdf_path, self.current_selection['start'],
+               tuple((r['start'], r['end'], r.get('pdf_path')) for r in self.selected_ranges))
+        if self._selection_styles is not None and self._selection_styles[0] == key:
+            return self._selection_styles[1]
+        
+        styles = {}
+        if self.current_selection['start'] is not None:
+            styles[self.current_selection['start']] = 'start'
+        
+        # Completed ranges of the current PDF win over the selection start
         for range_data in self.selected_ranges:
-            # Only show ranges for the current PDF
             if range_data.get('pdf_path') != self.pdf_path:
                 continue
-                
-            for page in range(range_data['start'], range_data['end'] + 1):
-                # Find widget for this page
-                page_widget = None
-                for widget in self.page_widgets:
-                    if widget is not None and widget['page_num'] == page:
-                        page_widget = widget
-                        break
-                        
-                if not page_widget:
-                    continue  # Skip if thumbnail failed or page not found
-                    
-                if page == range_data['start'] and page == range_data['end']:
-                    # Single page
-                    self.set_page_color(page_widget, self.colors['start'])
-                    page_widget['status_label'].config(text="SINGLE", fg='darkgreen')
-                    page_widget['frame'].config(borderwidth=3, relief=tk.SOLID)
-                elif page == range_data['start']:
-                    # Start of range
-                    self.set_page_color(page_widget, self.colors['start'])
-                    page_widget['status_label'].config(text="START", fg='darkgreen')
-                    page_widget['frame'].config(borderwidth=3, relief=tk.SOLID)
-                elif page == range_data['end']:
-                    # End of range
-                    self.set_page_color(page_widget, self.colors['end'])
-                    page_widget['status_label'].config(text="END", fg='darkred')
-                    page_widget['frame'].config(borderwidth=3, relief=tk.SOLID)
-                else:
-                    # Middle of range
-                    self.set_page_color(page_widget, self.colors['selected'])
-                    page_widget['status_label'].config(text="SELECTED", fg='darkorange')
-                    page_widget['frame'].config(borderwidth=3, relief=tk.SOLID)
+            start, end = range_data['start'], range_data['end']
+            if start == end:
+                styles[start] = 'single'
+                continue
+            styles.update(dict.fromkeys(range(start + 1, end), 'selected'))
+            styles[start] = 'start'
+            styles[end] = 'end'
+        
+        self._selection_styles = (key, styles)
+        return styles
+
+    def update_selection_display(self):
+        """Update visual selection indicators"""
+        # One pass that gives every built page its final style; apply_page_style() only
+        # touches Tk for the pages whose look actually changes
+        styles = self.selection_styles()
+        unselected = 'edit_mode' if self.edit_mode else 'normal'
+        for page_num, widget in self.page_widgets_by_num.items():
+            self.apply_page_style(widget, styles.get(page_num, unselected))
                     
     def on_range_tree_click(self, event):
         """Handle clicks on the ranges tree, especially delete buttons"""
@@ -2285,14 +3456,27 @@ class VisualPDFSplitterApp:
                 self.status_var.set(f"Removed range: pages {removed_range['start']}-{removed_range['end']}")
                 
     def update_ranges_list(self):
-        """Update the selected ranges list with individual delete buttons"""
-        # Clear existing items
-        for item in self.ranges_tree.get_children():
-            self.ranges_tree.delete(item)
+        """Update the selected ranges list with individual delete buttons
+
+        Rows are matched to their range by identity (ranges are only appended or
+        removed), so only the rows of added or removed ranges are touched.
+        """
+        # Drop the rows of removed ranges in one call
+        current = {id(range_data) for range_data in self.selected_ranges}
+        kept_rows = {}
+        stale_items = []
+        for row in self._range_rows:
+            if id(row[0]) in current:
+                kept_rows[id(row[0])] = row
+            else:
+                stale_items.append(row[1])
+        if stale_items:
+            self.ranges_tree.delete(*stale_items)
             
         # Add current ranges
         total_pages = 0
-        for range_data in self.selected_ranges:
+        self._range_rows = []
+        for index, range_data in enumerate(self.selected_ranges):
             start, end, pages = range_data['start'], range_data['end'], range_data['pages']
             pdf_filename = range_data.get('pdf_filename', 'Unknown')
             total_pages += pages
@@ -2302,8 +3486,16 @@ class VisualPDFSplitterApp:
             else:
                 range_text = f"Pages {start}-{end}"
                 
-            # Insert with delete button in first column
-            self.ranges_tree.insert("", tk.END, values=("❌", range_text, pages, pdf_filename))
+            # Delete button in first column
+            values = ("❌", range_text, pages, pdf_filename)
+            row = kept_rows.get(id(range_data))
+            if row is None:
+                item = self.ranges_tree.insert("", index, values=values)
+            else:
+                item = row[1]
+                if row[2] != values:
+                    self.ranges_tree.item(item, values=values)
+            self._range_rows.append((range_data, item, values))
             
         # Update count
         range_count = len(self.selected_ranges)
@@ -2348,49 +3540,55 @@ class VisualPDFSplitterApp:
         else:
             self.status_var.set(f"Page {page_number} rotated to {new_rotation}°")
         
-        # Regenerate the affected thumbnail and refresh display
-        self.regenerate_single_thumbnail(page_number)
+        # Turn the displayed thumbnail and update its caption in place
+        self.regenerate_single_thumbnail(page_number, angle)
         
-        # Refresh the display to show updated rotation
-        self.display_thumbnails(force_rebuild=True)
+        widget = self.get_page_widget(page_number)
+        if widget is not None:
+            widget['page_label'].config(text=self.page_label_text(widget['slot'], page_number))
         
-    def regenerate_single_thumbnail(self, page_number):
-        """Regenerate thumbnail for a single page"""
+    def regenerate_single_thumbnail(self, page_number, angle=0):
+        """Regenerate thumbnail for a single page after it was rotated by `angle` degrees
+
+        A thumbnail that is already shown is turned in memory (quarter turns are lossless
+        pixel transposes); pages without one pick up the rotation when they are rendered.
+        """
         try:
             page_index = page_number - 1  # Convert to 0-based index
             
             if page_index < 0 or page_index >= len(self.pdf_document):
                 return
-                
-            # Render the specific page
-            page = self.pdf_document[page_index]
-            
-            # Calculate zoom factor
-            page_rect = page.rect
-            zoom = self.thumbnail_size / max(page_rect.width, page_rect.height)
-            mat = fitz.Matrix(zoom, zoom)
-            
-            # Apply rotation if set for this page
-            if page_number in self.page_rotations:
-                rotation_angle = self.page_rotations[page_number]
-                mat = mat.prerotate(rotation_angle)  # Use prerotate instead of matrix multiplication
+
+            photo = self.page_thumbnails[page_index]
+            if photo is None:
+                return
             
-            # Render page
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("ppm")
+            widget = self.get_page_widget(page_number)
+            if not angle % 360:
+                # Re-render through the render pool; the placeholder shows meanwhile
+                self.page_thumbnails[page_index] = None
+                self.live_thumbnails.pop(page_index, None)
+                if widget is not None:
+                    widget['thumb_label'].config(image=self.get_placeholder_thumbnail())
+                self.schedule_visible_renders()
+                return
             
-            # Create PIL image and convert to PhotoImage
-            img = Image.open(io.BytesIO(img_data))
+            # Negative = clockwise, matching apply_thumbnail_rotation()
+            # (getimage() returns opaque RGBA, which PhotoImage takes as is - no RGB copy)
+            img = ImageTk.getimage(photo).rotate(-angle, expand=True)
             photo = ImageTk.PhotoImage(img)
+            img.close()
             
             # Update the thumbnail in the list at the original page index
             self.page_thumbnails[page_index] = photo
+            self.live_thumbnails[page_index] = None
+            self.live_thumbnails.move_to_end(page_index)
             
-            # Note: Individual widget updating is handled by the display_thumbnails() call
-            # in rotate_page() function with force_rebuild=True
+            if widget is not None:
+                widget['thumb_label'].config(image=photo)
                 
         except Exception as e:
-            pass
+            print(f"Warning: Could not update thumbnail for page {page_number}: {e}")
             # Don't show error dialog for single thumbnail failures
             
     def clear_ranges_only(self):
@@ -2417,6 +3615,7 @@ class VisualPDFSplitterApp:
         # Also clear crops if in crop mode
         if self.crop_mode and self.crop_rectangles:
             self.crop_rectangles.clear()
+            self._total_crops = 0
             self.crop_thumbnails.clear()
             self.crop_counter = 0
             
@@ -2441,17 +3640,17 @@ class VisualPDFSplitterApp:
             self.status_var.set("All rotations cleared")
             # Regenerate all thumbnails
             if self.pdf_document:
-                threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+                self.generate_thumbnails()
         
     def zoom_in(self):
         """Increase thumbnail size"""
-        new_size = min(self.max_zoom, self.thumbnail_size + self.zoom_step)
+        new_size = min(self.max_zoom, self.pending_zoom_size + self.zoom_step)
         self.zoom_var.set(new_size)
         self.on_zoom_change(new_size)
         
     def zoom_out(self):
         """Decrease thumbnail size"""
-        new_size = max(self.min_zoom, self.thumbnail_size - self.zoom_step)
+        new_size = max(self.min_zoom, self.pending_zoom_size - self.zoom_step)
         self.zoom_var.set(new_size)
         self.on_zoom_change(new_size)
         
@@ -2464,24 +3663,36 @@ class VisualPDFSplitterApp:
         """Switch to single page view mode (called automatically by zoom)"""
         self.view_mode = 'single'
         if self.page_thumbnails:
-            self.status_var.set("Updating view mode...")
-            threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+            # Same thumbnail size - only the layout changes, the rendered pages are reused
+            self.display_thumbnails(force_rebuild=True)
         
     def set_grid_view(self):
         """Switch to grid view mode (called automatically by zoom)"""
         self.view_mode = 'grid'
         if self.page_thumbnails:
-            self.status_var.set("Updating view mode...")
-            threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+            # Same thumbnail size - only the layout changes, the rendered pages are reused
+            self.display_thumbnails(force_rebuild=True)
         
     def on_zoom_change(self, value):
-        """Handle zoom slider change with automatic view mode switching"""
+        """Handle zoom slider change, coalescing rapid changes into a single re-render"""
         new_size = int(float(value))
+        self.zoom_label.config(text=f"{new_size}px")
+
+        # Only the last value of a slider drag or wheel burst triggers rendering
+        self.pending_zoom_size = new_size
+        if self._zoom_after is not None:
+            self.root.after_cancel(self._zoom_after)
+        self._zoom_after = self.root.after(self.ZOOM_DEBOUNCE_MS, self.apply_zoom)
+
+    def apply_zoom(self):
+        """Apply the requested zoom level with automatic view mode switching"""
+        self._zoom_after = None
+        new_size = self.pending_zoom_size
         if new_size == self.thumbnail_size:
             return
             
+        previous_size = self.thumbnail_size
         self.thumbnail_size = new_size
-        self.zoom_label.config(text=f"{new_size}px")
         
         # Automatic view mode switching based on zoom level
         previous_view_mode = self.view_mode
@@ -2495,67 +3706,73 @@ class VisualPDFSplitterApp:
             view_name = "Single Page" if self.view_mode == 'single' else "Grid"
             self.status_var.set(f"Switched to {view_name} view (zoom: {new_size}px)")
         
-        # Regenerate thumbnails if PDF is loaded
+        # Regenerate thumbnails if PDF is loaded (only visible pages are re-rendered)
         if self.pdf_document:
-            if previous_view_mode != self.view_mode:
-                self.status_var.set(f"Updating to {view_name} view...")
-                # Only do full regeneration when view mode changes
-                threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+            if previous_view_mode == self.view_mode and self._row_pitch and self.page_widgets_by_num:
+                # Same view - keep the page widgets and rescale what is already shown
+                self.resize_thumbnails(previous_size)
             else:
-                self.status_var.set("Updating thumbnail size...")
-                # For size-only changes, just regenerate existing thumbnails more efficiently
-                threading.Thread(target=self.regenerate_thumbnails_for_zoom, daemon=True).start()
-            
-    def regenerate_thumbnails_for_zoom(self):
-        """Efficiently regenerate thumbnails for zoom changes without losing state"""
-        if not self.pdf_document or not self.page_thumbnails:
-            return
-            
-        try:
-            total_pages = len(self.pdf_document)
-            
-            # Generate new thumbnails at the new size - keep original page indexing
-            new_thumbnails = [None] * total_pages
-            
-            for page_num in range(total_pages):
-                try:
-                    # Show progress
-                    self.root.after(0, lambda p=page_num, t=total_pages: 
-                                   self.status_var.set(f"Updating thumbnails... {p+1}/{t}"))
-                    
-                    page = self.pdf_document[page_num]
-                    page_rect = page.rect
-                    
-                    # Calculate zoom factor to fit thumbnail size
-                    zoom = self.thumbnail_size / max(page_rect.width, page_rect.height)
-                    
-                    # Get rotation for this page (use 1-based page number for rotations)
-                    rotation = self.page_rotations.get(page_num + 1, 0)
-                    
-                    # Create image with proper rotation
-                    mat = fitz.Matrix(zoom, zoom).prerotate(rotation)
-                    pix = page.get_pixmap(matrix=mat)
-                    img_data = pix.tobytes("ppm")
-                    img = Image.open(io.BytesIO(img_data))
-                    
-                    # Convert to PhotoImage
-                    photo = ImageTk.PhotoImage(img)
-                    new_thumbnails[page_num] = photo
-                    
-                except Exception as e:
-                    pass
-                    new_thumbnails[page_num] = None
+                self.generate_thumbnails()
             
-            # Update thumbnails list - maintain original page indexing
-            self.page_thumbnails = new_thumbnails
+    def resize_thumbnails(self, previous_size):
+        """Show the current document at the new thumbnail size without rebuilding the grid
+
+        The thumbnails on screen are rescaled in memory straight away. Shrunk ones are
+        kept; enlarged ones would be blurry, so they only stand in until the sharper
+        render arrives. Off-screen thumbnails are dropped and rendered when needed.
+        """
+        self.cancel_pending_renders()
+        size = self.thumbnail_size
+        scale = size / previous_size
+        
+        shown = {widget['page_index']: widget for widget in self.page_widgets_by_num.values()}
+        placeholder = self.get_placeholder_thumbnail()
+        for page_index in list(self.live_thumbnails):
+            photo = self.page_thumbnails[page_index]
+            self.page_thumbnails[page_index] = None
+            del self.live_thumbnails[page_index]
+            
+            widget = shown.get(page_index)
+            if widget is None or photo is None:
+                continue
+            img = ImageTk.getimage(photo)
+            img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                             Image.Resampling.BILINEAR)
+            photo = ImageTk.PhotoImage(img)
+            widget['thumb_label'].config(image=photo)
+            shown.pop(page_index)
+            if scale < 1:
+                self.page_thumbnails[page_index] = photo
+                self.live_thumbnails[page_index] = None
+            else:
+                widget['preview'] = photo  # Keep the stand-in alive until it is replaced
+        for widget in shown.values():
+            widget['thumb_label'].config(image=placeholder)
+        
+        # Thumbnail height is part of every row, so the row pitch moves with the size
+        self.relayout_thumbnail_grid(self._row_pitch + size - previous_size)
+        
+    def relayout_thumbnail_grid(self, row_pitch=None):
+        """Move the existing page widgets to the current column count and row height"""
+        margin, cols, thumb_width = self._layout = self.grid_layout(self.canvas.winfo_width())
+        if row_pitch is not None:
+            self._row_pitch = row_pitch
+        
+        with self.frozen_layout():
+            for widget in self.page_widgets_by_num.values():
+                widget['frame'].grid_configure(row=widget['slot'] // cols, column=widget['slot'] % cols)
             
-            # Update display with the new thumbnails
-            self.root.after(0, lambda: self.display_thumbnails(force_rebuild=True))
-            self.root.after(0, lambda: self.status_var.set("Thumbnails updated"))
+            rows = -(-len(self._grid_entries) // cols)
+            for row in range(rows):
+                self.thumbnails_frame.rowconfigure(row, minsize=self._row_pitch)
+            for row in range(rows, self._grid_rows):
+                self.thumbnails_frame.rowconfigure(row, minsize=0)
+            self._grid_rows = rows
             
-        except Exception as e:
-            pass
-            self.root.after(0, lambda: self.status_var.set("Error updating thumbnails"))
+            # The viewport now covers other slots
+            self.refresh_visible_widgets()
+        
+        self.schedule_visible_renders()
             
     def split_and_save(self):
         """Split PDF and save selected ranges"""
@@ -2568,6 +3785,10 @@ class VisualPDFSplitterApp:
             messagebox.showwarning("Warning", "Please select at least one page range first.")
             return
             
+        if self._split_running:
+            messagebox.showinfo("Info", "A split is already being written.")
+            return
+            
         
         # Get filename choice from user
         try:
@@ -2594,117 +3815,267 @@ class VisualPDFSplitterApp:
         if not save_path:
             return
             
-        # Split directly in main thread for debugging
         self._split_pdf_direct(save_path)
         
     def _split_pdf_direct(self, save_path):
-        """Split PDF directly (for debugging)"""
+        """Split the selected ranges into a ZIP at save_path
+
+        The render pool builds the ranges and a background thread writes the ZIP, so
+        the window stays responsive; without a pool the split runs on the Tk thread.
+        """
+        # Show progress bar
+        self.progress_bar.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.status_var.set("Splitting PDF...")
+        self.progress_var.set(0)
+        
+        try:
+            jobs = self.plan_split_jobs()
+        except Exception as e:
+            self.finish_split(save_path, e)
+            return
+        
         try:
+            pool = self.get_render_pool()
+        except Exception as e:
+            print(f"Warning: Render pool unavailable, splitting in-process: {e}")
+            self.shutdown_render_pool()
+            pool = None
+        
+        if pool is None:
+            self.root.update_idletasks()
+            self.finish_split(save_path, self.write_split_zip(save_path, jobs, None), len(jobs))
+        else:
+            # One split at a time; finish_split re-enables the buttons
+            self._split_running = True
+            self.update_buttons_for_background_tasks()
+            threading.Thread(target=self.run_split_thread, args=(save_path, jobs, pool),
+                             daemon=True).start()
+            
+    def plan_split_jobs(self):
+        """Validate the selected ranges and describe each output file
+
+        Runs on the Tk thread because it reads the open documents and page rotations.
+        Returns (filename, source path, file to read, start, end, rotations, whole file)
+        tuples with 0-based page numbers, in selection order.
+        """
+        jobs = []
+        for i, range_data in enumerate(self.selected_ranges):
+            start_page = range_data['start'] - 1  # Convert to 0-indexed
+            end_page = range_data['end'] - 1
+            pdf_source_path = range_data['pdf_path']
+            
+            # Read the source PDF - the document cache opens each file once (the one
+            # on screen is reused) and picks up session edits of other PDFs
+            source_doc = self.get_document(pdf_source_path)
+            total_pdf_pages = len(source_doc)
+            
+            # Validate range
+            if start_page < 0 or end_page >= total_pdf_pages or start_page > end_page:
+                continue
             
-            # Show progress bar
-            self.progress_bar.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
-            self.status_var.set("Splitting PDF...")
-            self.progress_var.set(0)
-            self.root.update()
+            # Apply rotation if set for these pages (1-based)
+            rotations = {}
+            if pdf_source_path == self.pdf_path:
+                for page_number in range(start_page + 1, end_page + 2):
+                    rotation_angle = self.page_rotations.get(page_number, 0)
+                    if rotation_angle in (90, 180, 270):
+                        rotations[page_number - start_page - 1] = rotation_angle
             
-            # Create ZIP file
-            with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                total_ranges = len(self.selected_ranges)
+            # Generate filename
+            try:
+                base_name = Path(pdf_source_path).stem
+            except:
+                base_name = f"document_{i+1}"
                 
-                for i, range_data in enumerate(self.selected_ranges):
-                    start_page = range_data['start'] - 1  # Convert to 0-indexed
-                    end_page = range_data['end'] - 1
-                    pdf_source_path = range_data['pdf_path']
-                    
-                    
-                    # Update progress
-                    progress = (i / total_ranges) * 90
-                    self.progress_var.set(progress)
-                    self.status_var.set(f"Processing range {i+1}/{total_ranges}...")
-                    self.root.update()
+            if start_page == end_page:
+                filename = f"{base_name}_page_{start_page + 1}.pdf"
+            else:
+                filename = f"{base_name}_pages_{start_page + 1}-{end_page + 1}.pdf"
+            
+            # A whole unrotated document is copied byte for byte instead of rebuilt.
+            # Encrypted files are still rebuilt, which writes them out decrypted
+            whole_file = (start_page == 0 and end_page == total_pdf_pages - 1 and not rotations
+                          and not source_doc.metadata.get('encryption'))
+            
+            # Workers and file copies read the edited copy of a PDF if there is one
+            jobs.append((filename, pdf_source_path, self.get_actual_pdf_path(pdf_source_path),
+                         start_page, end_page, rotations, whole_file))
+        return jobs
+            
+    def run_split_thread(self, save_path, jobs, pool):
+        """Background thread body: write the split ZIP, then report back on the Tk thread"""
+        error = self.write_split_zip(save_path, jobs, pool)
+        self.root.after(0, self.finish_split, save_path, error, len(jobs))
+            
+    def write_split_zip(self, save_path, jobs, pool):
+        """Build the planned ranges and write them to a ZIP at save_path
+
+        Ranges are built by the render pool (in-process when pool is None) and written
+        in order; only a few finished PDFs are held in memory at a time. Returns the
+        exception that stopped the split, or None on success.
+        """
+        partial_zip = False  # True while save_path holds an unfinished ZIP
+        try:
+            # Entries are stored uncompressed: PDF streams are already deflated, so
+            # recompressing wastes CPU
+            with open(save_path, 'wb', buffering=self.ZIP_WRITE_BUFFER) as zip_out, \
+                    zipfile.ZipFile(zip_out, 'w', zipfile.ZIP_STORED) as zip_file:
+                partial_zip = True
+                max_pending = 2 * self.render_worker_count()
+                pending = deque()  # (filename, future, PDF bytes or path to copy) in range order
+                written = 0
+                
+                for filename, source_path, read_path, start_page, end_page, rotations, whole_file in jobs:
+                    if whole_file:
+                        result = read_path
+                    elif pool is not None:
+                        result = pool.submit(_build_range_pdf, read_path, start_page, end_page, rotations)
+                    else:
+                        result = _copy_page_range(self.get_document(source_path),
+                                                  start_page, end_page, rotations)
+                    pending.append((filename, result))
                     
-                    # Read the source PDF
-                    with open(pdf_source_path, 'rb') as file:
-                        pdf_reader = PyPDF2.PdfReader(file)
-                        total_pdf_pages = len(pdf_reader.pages)
-                        
-                        # Validate range
-                        if start_page < 0 or end_page >= total_pdf_pages or start_page > end_page:
-                            continue
-                        
-                        # Create new PDF for this range
-                        pdf_writer = PyPDF2.PdfWriter()
-                        
-                        for page_num in range(start_page, end_page + 1):
-                            if page_num < total_pdf_pages:
-                                page = pdf_reader.pages[page_num]
-                                
-                                # Apply rotation if set for this page (1-based)
-                                page_number_1based = page_num + 1
-                                if page_number_1based in self.page_rotations and pdf_source_path == self.pdf_path:
-                                    rotation_angle = self.page_rotations[page_number_1based]
-                                    if rotation_angle == 90:
-                                        page = page.rotate(90)
-                                    elif rotation_angle == 180:
-                                        page = page.rotate(180)
-                                    elif rotation_angle == 270:
-                                        page = page.rotate(270)
-                                
-                                pdf_writer.add_page(page)
-                        
-                        # Write PDF to memory
-                        pdf_buffer = io.BytesIO()
-                        pdf_writer.write(pdf_buffer)
-                        pdf_buffer.seek(0)
-                        pdf_data = pdf_buffer.getvalue()
-                        
-                        
-                        # Generate filename
-                        try:
-                            base_name = Path(pdf_source_path).stem
-                        except:
-                            base_name = f"document_{i+1}"
-                            
-                        if start_page == end_page:
-                            filename = f"{base_name}_page_{start_page + 1}.pdf"
-                        else:
-                            filename = f"{base_name}_pages_{start_page + 1}-{end_page + 1}.pdf"
-                        
-                        
-                        # Add to ZIP
-                        zip_file.writestr(filename, pdf_data)
-                        
-            # Complete
-            self.progress_var.set(100)
-            self.status_var.set("PDF split successfully!")
-            self.root.update()
+                    # Write finished ranges in order, keeping at most max_pending in flight
+                    written = self.write_split_entries(zip_file, pending, max_pending, written,
+                                                       len(jobs), pool is not None)
+                self.write_split_entries(zip_file, pending, 0, written, len(jobs), pool is not None)
+            partial_zip = False
+        except Exception as e:
+            if not self._closing:
+                import traceback
+                traceback.print_exc()  # Debug
+            
+            # Don't leave a half-written ZIP behind
+            if partial_zip:
+                with contextlib.suppress(OSError):
+                    os.remove(save_path)
+            return e
+        return None
             
+    def write_split_entries(self, zip_file, pending, keep, written, total_ranges, threaded):
+        """Write split ranges to the ZIP in order until at most `keep` are pending
+
+        Progress goes through after() when running on the split thread. Returns the
+        updated count of written ranges.
+        """
+        while len(pending) > keep:
+            # The window is being closed - stop so the unfinished ZIP gets removed
+            if self._closing:
+                raise RuntimeError("Split cancelled")
+            filename, result = pending.popleft()
+            
+            # Stored as is (a ZipInfo carries its own compression and timestamp;
+            # the ZipFile defaults do not apply to it)
+            entry_info = zipfile.ZipInfo(filename, date_time=time.localtime()[:6])
+            entry_info.compress_type = zipfile.ZIP_STORED
+            if isinstance(result, str):
+                # Whole source file: stream it into the entry in large chunks
+                large = os.path.getsize(result) > zipfile.ZIP64_LIMIT
+                with open(result, 'rb') as source, \
+                        zip_file.open(entry_info, 'w', force_zip64=large) as entry:
+                    shutil.copyfileobj(source, entry, self.ZIP_COPY_CHUNK)
+            else:
+                pdf_data = result if isinstance(result, bytes) else result.result()
+                zip_file.writestr(entry_info, pdf_data)
             
-            messagebox.showinfo("Success", 
-                f"PDF split into {len(self.selected_ranges)} files successfully!\n\n"
-                f"Saved to:\n{save_path}\n\n"
-                f"Files created: {len(self.selected_ranges)} PDFs in ZIP")
+            # Update progress
+            written += 1
+            if threaded:
+                self.root.after(0, self.show_split_progress, written, total_ranges)
+            else:
+                self.show_split_progress(written, total_ranges)
+                self.root.update_idletasks()
+        return written
             
-        except Exception as e:
-            import traceback
-            traceback.print_exc()  # Debug
+    def show_split_progress(self, written, total_ranges):
+        """Show how many split ranges have been written"""
+        self.progress_var.set((written / total_ranges) * 90)
+        self.status_var.set(f"Processing range {written}/{total_ranges}...")
             
-            messagebox.showerror("Error", 
-                f"Failed to split PDF:\n\n{str(e)}\n\nCheck the console for more details.")
-            self.status_var.set("Error splitting PDF")
+    def finish_split(self, save_path, error, file_count=0):
+        """Report the end of a split (error is None on success) and hide the progress bar
+
+        file_count is the number of planned files written to the ZIP; the selected
+        ranges may have been edited while a background split was running.
+        """
+        self._split_running = False
+        if self._closing:
+            # request_close destroys the window now that the split has stopped
+            return
+        self.update_buttons_for_background_tasks()
+        try:
+            if error is None:
+                # Complete
+                self.progress_var.set(100)
+                self.status_var.set("PDF split successfully!")
+                self.root.update_idletasks()
+                
+                messagebox.showinfo("Success", 
+                    f"PDF split into {file_count} files successfully!\n\n"
+                    f"Saved to:\n{save_path}\n\n"
+                    f"Files created: {file_count} PDFs in ZIP")
+            else:
+                messagebox.showerror("Error", 
+                    f"Failed to split PDF:\n\n{str(error)}\n\nCheck the console for more details.")
+                self.status_var.set("Error splitting PDF")
         finally:
             # Hide progress bar
             self.progress_bar.grid_remove()
             
+    def request_close(self):
+        """Close the window, first stopping a running split or crop export
+
+        The unfinished split ZIP is removed; crop files already being written are
+        completed and the remaining crops are skipped.
+        """
+        if self._split_running or self._export_running:
+            if not messagebox.askyesno("Export in Progress",
+                                       "A split or crop export is still being written.\n\n"
+                                       "Stop it and quit? An unfinished split ZIP will be removed."):
+                return
+            self._closing = True
+            self.status_var.set("Stopping...")
+            # Cancels the queued ranges and crops; the split thread stops at its next entry
+            self.shutdown_render_pool()
+            self.close_when_idle()
+            return
+        self.shutdown_render_pool()
+        self.root.destroy()
+            
+    def close_when_idle(self):
+        """Destroy the window once background work has cleaned up (Tk keeps running meanwhile)"""
+        if self._split_running or self._export_running:
+            self.root.after(100, self.close_when_idle)
+            return
+        self.shutdown_render_pool()
+        self.root.destroy()
+            
     def on_canvas_configure(self, event):
         """Handle canvas resize"""
         # Update the canvas window width to match canvas width
         canvas_width = event.width
         self.canvas.itemconfig(self.canvas_window, width=canvas_width)
         
-        # Trigger thumbnail redisplay for new layout
+        # Trigger thumbnail redisplay for new layout once resizing pauses
         if self.page_thumbnails and hasattr(self, 'thumbnails_frame'):
-            self.root.after(100, self.display_thumbnails)
+            if self._resize_after is not None:
+                self.root.after_cancel(self._resize_after)
+            self._resize_after = self.root.after(self.RESIZE_DEBOUNCE_MS, self.apply_canvas_resize)
+            
+    def apply_canvas_resize(self):
+        """Re-lay out the thumbnail grid if the new canvas width changes its column count"""
+        self._resize_after = None
+        if not self.page_thumbnails:
+            return
+            
+        if not self._row_pitch:
+            # No grid built yet (the canvas had no width) - build it now
+            self.display_thumbnails(force_rebuild=True)
+        elif self.grid_layout(self.canvas.winfo_width()) != self._layout:
+            self.relayout_thumbnail_grid()
+        else:
+            # Same grid - only newly exposed pages need rendering
+            self.schedule_visible_renders()
                 
     def on_frame_configure(self, event):
         """Handle thumbnails frame resize"""
@@ -2714,252 +4085,132 @@ class VisualPDFSplitterApp:
         """Show dialog to choose between default or custom filename
         
         Args:
-            default_name: The default filename the app would use
-            file_type: Type of file being saved (PDF, ZIP, etc.)
-            pattern_preview: For multi-file saves, show pattern preview
-            
-        Returns:
-            str: Chosen filename, or None if cancelled
-        """
-        dialog = tk.Toplevel(self.root)
-        dialog.title(f"Choose {file_type} Filename")
-        dialog.geometry("500x300")
-        dialog.resizable(False, False)
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
-        
-        result = {"filename": None}
-        
-        # Main frame
-        main_frame = ttk.Frame(dialog, padding="20")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        ttk.Label(main_frame, text=f"How do you want to name your {file_type} file?", 
-                 font=(self.FONT_FAMILY, 12, "bold")).pack(pady=(0, 15))
-        
-        # Choice variable
-        choice_var = tk.StringVar(value="default")
-        
-        # Default option
-        default_frame = ttk.Frame(main_frame)
-        default_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Radiobutton(default_frame, text="Use default naming:", 
-                       variable=choice_var, value="default").pack(anchor=tk.W)
-        
-        default_label = ttk.Label(default_frame, text=default_name, 
-                                 font=(self.FONT_FAMILY, 9), foreground="blue")
-        default_label.pack(anchor=tk.W, padx=(25, 0))
-        
-        if pattern_preview:
-            pattern_label = ttk.Label(default_frame, text=pattern_preview, 
-                                    font=(self.FONT_FAMILY, 8), foreground="gray")
-            pattern_label.pack(anchor=tk.W, padx=(25, 0))
-        
-        # Separator
-        ttk.Separator(main_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=15)
-        
-        # Custom option
-        custom_frame = ttk.Frame(main_frame)
-        custom_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Radiobutton(custom_frame, text="Use custom name:", 
-                       variable=choice_var, value="custom").pack(anchor=tk.W)
-        
-        # Custom input
-        input_frame = ttk.Frame(custom_frame)
-        input_frame.pack(fill=tk.X, padx=(25, 0), pady=5)
-        
-        custom_entry = ttk.Entry(input_frame, font=(self.FONT_FAMILY, 10))
-        custom_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Set default custom name (without extension)
-        base_name = Path(default_name).stem
-        custom_entry.insert(0, base_name)
-        
-        # Extension label
-        ext = Path(default_name).suffix
-        ttk.Label(input_frame, text=ext, font=(self.FONT_FAMILY, 10)).pack(side=tk.LEFT, padx=(5, 0))
-        
-        # Buttons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=(20, 0))
-        
-        def on_ok():
-            if choice_var.get() == "default":
-                result["filename"] = default_name
-            else:
-                custom_name = custom_entry.get().strip()
-                if not custom_name:
-                    messagebox.showwarning("Warning", "Please enter a custom filename.")
-                    return
-                # Add extension if not present
-                if not custom_name.endswith(ext):
-                    custom_name += ext
-                result["filename"] = custom_name
-            dialog.destroy()
-        
-        def on_cancel():
-            dialog.destroy()
-        
-        ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side=tk.RIGHT, padx=(5, 0))
-        ttk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.RIGHT)
-        
-        # Enable custom entry when custom radio is selected
-        def on_choice_change():
-            if choice_var.get() == "custom":
-                custom_entry.config(state=tk.NORMAL)
-                custom_entry.focus_set()
-                custom_entry.select_range(0, tk.END)
-            else:
-                custom_entry.config(state=tk.DISABLED)
-        
-        choice_var.trace_add("write", lambda *args: on_choice_change())
-        on_choice_change()  # Initial state
-        
-        # Handle Enter key
-        dialog.bind('<Return>', lambda e: on_ok())
-        dialog.bind('<Escape>', lambda e: on_cancel())
-        
-        dialog.wait_window()
-        return result["filename"]
-    
-    def show_help(self):
-        """Show help dialog"""
-        help_text = """Homemade PDF Editor - How to Use
-
-🚀 QUICK START:
-1. Click "Select PDF File" or "Select Folder" to load documents
-2. Wait for page thumbnails to appear
-3. Select pages for splitting OR use crop mode for area extraction OR edit pages
-4. Click "Split & Save ZIP", extract crops, or save edited PDF
-
-📁 FOLDER MODE:
-• Select a folder containing multiple PDF files
-• Use ⬅️➡️ keys to navigate between PDFs
-• Use ⬆️⬇️ keys to scroll through pages
-• Select ranges from any PDF in the folder
-
-✏️ EDIT MODE:
-• Toggle "✏️ Edit Mode" to enable comprehensive page editing
-• Drag any page thumbnail to rearrange pages
-• Click ❌ button on pages to delete them
-• Use ↺↻ rotation buttons to rotate pages (only available in edit mode)
-• Drop between pages to insert at that position
-• Blue highlighting shows valid drop zones during drag
-• Page numbers show current position (e.g., "#1: Page 5" means Page 5 is now in position 1)
-• Deleted pages are removed from the document entirely
-• Click "Reset" to restore original order, deleted pages, and rotations
-• Click "Save PDF" to save all edits (reorder, deletions, rotations) as a new PDF file
-• Edit mode consolidates all page modification operations
-
-✂️ CROP MODE:
-• Toggle crop mode with "✂️ Crop Mode" checkbox
-• Drag on page thumbnails to select rectangular areas
-• Multiple crops per page supported
-• Extract crops as PDF files (vector quality) or PNG images (raster)
-• Automatic filename generation with page and crop numbers
-• Preview crops in the right panel with individual delete buttons
-
-📖 PAGE SELECTION:
-• First click: Sets START of range (green)
-• Second click: Sets END of range (red) 
-• Pages between: Automatically selected (yellow)
-• Same page twice: Single page selection
-• Individual ❌ buttons: Click to delete specific ranges
-
-🎯 OPERATION EXAMPLES:
-• Pages 1-10: Click page 1, then click page 10
-• Single page 5: Click page 5, then click page 5 again
-• Multiple ranges: Complete one range, then start another
-• Delete specific range: Click ❌ button next to the range
-• Crop areas: Enable crop mode, drag on thumbnails to select regions
-• Reorder pages: Enable edit mode, drag pages to new positions
-• Delete pages: Enable edit mode, click ❌ on pages to remove them
-• Rotate pages: Enable edit mode, use ↺↻ buttons
-
-🛠️ CONTROLS:
-• Thumbnail Size: Use slider, +/- buttons, or Ctrl+Mouse Wheel (up to 1600px!)
-• Automatic View Switching: Grid view under 500px, Single view at 500px+
-• Mouse wheel: Scroll through pages
-• Ctrl+Mouse wheel: Zoom in/out (like web browsers)
-• Clear Ranges: Remove page ranges (in Selected Ranges panel)
-• Clear Crops: Remove crop rectangles (in Crop Previews panel)
-• Reset: Restore original order, deleted pages, and rotations (edit mode)
-• Individual Delete: Click ❌ buttons next to ranges/crops to remove specific items
-
-⌨️ KEYBOARD SHORTCUTS:
-• Ctrl+O: Open PDF file
-• Ctrl+Shift+O: Open folder
-• Ctrl+C: Clear all selections
-• Ctrl+R: Reset edit session (restore all changes)
-• Ctrl+S: Save edited PDF
-• Ctrl+T: Toggle crop mode
-• Ctrl+E: Toggle edit mode
-• Ctrl+P: Extract crops as PDF
-• Ctrl+G: Extract crops as PNG
-• Ctrl++/Ctrl+-: Zoom in/out
-• Ctrl+Mouse Wheel: Zoom in/out (like web browsers)
-• Ctrl+0: Reset zoom
-• ⬆️⬇️: Navigate between PDFs (folder mode)
-• ⬅️➡️: Scroll through pages
-• F1: Show this help
-
-🎨 VISUAL INDICATORS:
-🟢 Green border + "START": Beginning of range
-🔴 Red border + "END": End of range
-🟡 Yellow border + "SELECTED": Pages in range
-🔵 Blue hover: Page you're about to click
-🟠 Orange: Page being dragged (edit mode)
-🔵 Blue highlight: Valid drop zone (edit mode)
-🟣 Lavender background: Edit mode active
-✂️ Crosshair cursor: Crop mode active
-✏️ Position numbers: Current page order (e.g., "#2: Page 7")
-❌ Delete buttons: Remove pages or crops
-↺↻ Rotation buttons: Only visible in edit mode
-
-📦 OUTPUT OPTIONS:
-• Split PDFs: Creates ZIP with separate PDFs for each range
-• Crop PDFs: Creates individual PDF files for each crop area
-• Crop PNGs: Creates PNG images for each crop area
-• Edited PDF: Saves current page order with deletions and rotations applied
-• Automatic filename generation with source info
-• Preserves original PDF quality and applies all edits
-
-💡 TIPS:
-• Zoom automatically switches view modes (Grid < 500px, Single ≥ 500px)
-• Larger thumbnails help identify pages and make editing/cropping easier
-• You can select overlapping ranges
-• Crop mode works best with zoomed-in thumbnails
-• Edit mode consolidates all page editing in one place
-• Right panel shows selected ranges and crop previews with more space
-• Click ❌ buttons for quick individual removal of ranges/crops/pages
-• Navigation buttons appear when multiple PDFs loaded
-• Edit changes are preserved when switching between crop/selection modes
-• Page rotations only work in edit mode for consistency
-• Deleted pages are completely removed from the final document
-
-⚠️ IMPORTANT NOTES:
-• Only one mode can be active at a time (Selection, Crop, or Edit)
-• Editing only affects the current PDF (not folder-wide)
-• Original PDF is never modified - all operations create new files
-• Edited pages maintain their formatting
-• Page numbers in edit view show both position and original page
-• Deleted pages cannot be recovered except by clicking "Reset"
-• Rotation buttons only appear in edit mode
-
-⚠️ REQUIREMENTS:
-• PDF files only (no password protection)
-• Minimum 16MB free disk space
-• At least one page range, crop area, or edit operation must be performed"""
+            default_name: The default filename the app would use
+            file_type: Type of file being saved (PDF, ZIP, etc.)
+            pattern_preview: For multi-file saves, show pattern preview
+            
+        Returns:
+            str: Chosen filename, or None if cancelled
+        """
+        dialog = tk.Toplevel(self.root)
+        # Keep the dialog hidden while it is built so it appears fully laid out
+        dialog.withdraw()
+        dialog.title(f"Choose {file_type} Filename")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        
+        result = {"filename": None}
+        
+        # Main frame
+        main_frame = ttk.Frame(dialog, padding="20")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Title
+        ttk.Label(main_frame, text=f"How do you want to name your {file_type} file?", 
+                 font=(self.FONT_FAMILY, 12, "bold")).pack(pady=(0, 15))
+        
+        # Choice variable
+        choice_var = tk.StringVar(value="default")
+        
+        # Default option
+        default_frame = ttk.Frame(main_frame)
+        default_frame.pack(fill=tk.X, pady=5)
+        
+        default_radio = ttk.Radiobutton(default_frame, text="Use default naming:", 
+                                        variable=choice_var, value="default")
+        default_radio.pack(anchor=tk.W)
+        
+        default_label = ttk.Label(default_frame, text=default_name, 
+                                 font=(self.FONT_FAMILY, 9), foreground="blue")
+        default_label.pack(anchor=tk.W, padx=(25, 0))
+        
+        if pattern_preview:
+            pattern_label = ttk.Label(default_frame, text=pattern_preview, 
+                                    font=(self.FONT_FAMILY, 8), foreground="gray")
+            pattern_label.pack(anchor=tk.W, padx=(25, 0))
+        
+        # Separator
+        ttk.Separator(main_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=15)
+        
+        # Custom option
+        custom_frame = ttk.Frame(main_frame)
+        custom_frame.pack(fill=tk.X, pady=5)
+        
+        custom_radio = ttk.Radiobutton(custom_frame, text="Use custom name:", 
+                                       variable=choice_var, value="custom")
+        custom_radio.pack(anchor=tk.W)
+        
+        # Custom input
+        input_frame = ttk.Frame(custom_frame)
+        input_frame.pack(fill=tk.X, padx=(25, 0), pady=5)
+        
+        custom_entry = ttk.Entry(input_frame, font=(self.FONT_FAMILY, 10))
+        custom_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Set default custom name (without extension)
+        base_name = Path(default_name).stem
+        custom_entry.insert(0, base_name)
+        
+        # Extension label
+        ext = Path(default_name).suffix
+        ttk.Label(input_frame, text=ext, font=(self.FONT_FAMILY, 10)).pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(20, 0))
+        
+        def on_ok():
+            if choice_var.get() == "default":
+                result["filename"] = default_name
+            else:
+                custom_name = custom_entry.get().strip()
+                if not custom_name:
+                    messagebox.showwarning("Warning", "Please enter a custom filename.")
+                    return
+                # Add extension if not present
+                if not custom_name.endswith(ext):
+                    custom_name += ext
+                result["filename"] = custom_name
+            dialog.destroy()
+        
+        def on_cancel():
+            dialog.destroy()
+        
+        ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.RIGHT)
+        
+        # Enable custom entry when custom radio is selected
+        def on_choice_change():
+            if choice_var.get() == "custom":
+                custom_entry.config(state=tk.NORMAL)
+                custom_entry.focus_set()
+                custom_entry.select_range(0, tk.END)
+            else:
+                custom_entry.config(state=tk.DISABLED)
+        
+        # Only the radio buttons change the choice, so their command is enough
+        default_radio.configure(command=on_choice_change)
+        custom_radio.configure(command=on_choice_change)
+        on_choice_change()  # Initial state
         
+        # Handle Enter key
+        dialog.bind('<Return>', lambda e: on_ok())
+        dialog.bind('<Escape>', lambda e: on_cancel())
+        
+        # Center the dialog, then show it
+        width, height = 500, 300
+        dialog.update_idletasks()
+        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
+        y = (dialog.winfo_screenheight() // 2) - (height // 2)
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
+        dialog.deiconify()
+        dialog.grab_set()
+        
+        dialog.wait_window()
+        return result["filename"]
+    
+    def show_help(self):
+        """Show help dialog"""
         help_window = tk.Toplevel(self.root)
         help_window.title("Help - Homemade PDF Editor")
         help_window.geometry("700x600")
@@ -2982,7 +4233,7 @@ class VisualPDFSplitterApp:
         text_widget = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD, 
                                               font=(self.FONT_FAMILY, 10), padx=10, pady=10)
         text_widget.pack(fill=tk.BOTH, expand=True)
-        text_widget.insert(tk.END, help_text)
+        text_widget.insert(tk.END, HELP_TEXT)
         text_widget.config(state=tk.DISABLED)
         
         # Close button
@@ -2994,52 +4245,7 @@ class VisualPDFSplitterApp:
         
     def show_about(self):
         """Show about dialog"""
-        about_text = """Homemade PDF Editor v5.1
-
-A powerful desktop application for splitting PDF files with visual page selection, thumbnail previews, comprehensive edit mode (drag & drop reordering + page deletion + rotation), multi-PDF folder support, and crop extraction functionality with enhanced visual feedback, browser-like zoom controls, and streamlined interface.
-
-🔧 FEATURES:
-• Visual page thumbnails for easy identification
-• Click-to-select page ranges
-• Comprehensive Edit Mode with drag & drop page reordering, deletion, and rotation
-• Multiple range selection support
-• Individual ❌ delete buttons for ranges, crops, and pages
-• Contextual clear and reset functions
-• Visual crop selection feedback with transparent overlay
-• Browser-like zoom controls (Ctrl+Mouse Wheel)
-• Clean, streamlined control interface with intelligent mode switching
-• Folder-based PDF loading with navigation
-• PDF navigation with arrow keys
-• Adjustable thumbnail zoom (up to 1600px)
-• Automatic view mode switching based on zoom level
-• Crop mode for area extraction with real-time visual feedback
-• Extract crops as PDF or PNG files
-• Enhanced crop preview panel with more space
-• ZIP file output with multiple PDFs
-• Save edited PDFs with all modifications applied
-• Modern, intuitive interface with visual mode indicators
-• Enhanced keyboard shortcuts
-• Progress tracking and status updates
-
-💻 TECHNICAL INFO:
-• Built with Python and tkinter
-• Uses PyMuPDF for PDF rendering and cropping
-• Uses PyPDF2 for PDF manipulation, reordering, and deletion
-• Advanced drag & drop implementation with ghost images
-• Comprehensive edit session management
-• Cross-platform compatibility
-• No internet connection required
-
-👨‍💻 DEVELOPED BY:
-Enhanced by Claude (Anthropic) with Comprehensive Edit Mode - December 2024
-
-🆓 LICENSE:
-Free for personal and commercial use
-
-📧 SUPPORT:
-For issues or questions, please refer to the documentation or contact support."""
-        
-        messagebox.showinfo("About Homemade PDF Editor", about_text)
+        messagebox.showinfo("About Homemade PDF Editor", ABOUT_TEXT)
 
     # ===== CROP FUNCTIONALITY =====
     
@@ -3097,11 +4303,21 @@ For issues or questions, please refer to the documentation or contact support.""
             
         # Store crop start position relative to the thumbnail image
         self.crop_start_pos = (event.x, event.y)
+        
+        # The thumbnail and page cannot change during a drag, so their geometry is
+        # read once here for update_crop and end_crop
+        thumb_label = widget['thumb_label']
+        page_index = page_num - 1
         self.current_crop = {
             'page': page_num,
             'start_x': event.x,
             'start_y': event.y,
-            'widget': widget
+            'widget': widget,
+            'label_x': thumb_label.winfo_x(),
+            'label_y': thumb_label.winfo_y(),
+            'thumb_width': thumb_label.winfo_width(),
+            'thumb_height': thumb_label.winfo_height(),
+            'page_rect': self.pdf_document[page_index].rect if page_index < len(self.pdf_document) else None
         }
         
         # Create overlay canvas for visual feedback
@@ -3155,18 +4371,7 @@ For issues or questions, please refer to the documentation or contact support.""
         
         # Update corner indicators to show current selection area
         if hasattr(self, 'crop_corner_widgets') and self.crop_corner_widgets:
-            # Clear existing corner indicators except the first one (start point)
-            for widget in self.crop_corner_widgets[1:]:
-                widget.destroy()
-            self.crop_corner_widgets = self.crop_corner_widgets[:1]
-            
-            # Get widget info
-            widget = self.get_page_widget(page_num)
-            if not widget:
-                return
-                
-            thumb_frame = widget['frame']
-            thumb_label = widget['thumb_label']
+            thumb_frame = self.current_crop['widget']['frame']
             
             # Calculate current rectangle
             start_x = self.current_crop['start_x']
@@ -3174,22 +4379,26 @@ For issues or questions, please refer to the documentation or contact support.""
             end_x = event.x
             end_y = event.y
             
-            # Create corner indicators for current rectangle
+            # Corner indicators for current rectangle
             corner_size = 6
-            label_x = thumb_label.winfo_x()
-            label_y = thumb_label.winfo_y()
+            label_x = self.current_crop['label_x']
+            label_y = self.current_crop['label_y']
             
-            # Add corner indicators at all four corners
+            # The other three corners (the first one is the start point)
             corners = [
                 (end_x + label_x, start_y + label_y),  # top-right
                 (start_x + label_x, end_y + label_y),  # bottom-left  
                 (end_x + label_x, end_y + label_y)     # bottom-right
             ]
             
-            for corner_x, corner_y in corners:
-                corner = tk.Frame(thumb_frame, bg='red', width=corner_size, height=corner_size)
+            # Motion events arrive constantly - create the indicators on the first one,
+            # afterwards only move them
+            while len(self.crop_corner_widgets) < 1 + len(corners):
+                self.crop_corner_widgets.append(
+                    tk.Frame(thumb_frame, bg='red', width=corner_size, height=corner_size))
+            
+            for corner, (corner_x, corner_y) in zip(self.crop_corner_widgets[1:], corners):
                 corner.place(x=corner_x - corner_size//2, y=corner_y - corner_size//2)
-                self.crop_corner_widgets.append(corner)
         
         # Store current coordinates
         self.current_crop.update({
@@ -3228,13 +4437,9 @@ For issues or questions, please refer to the documentation or contact support.""
         x1, x2 = min(start_x, end_x), max(start_x, end_x)
         y1, y2 = min(start_y, end_y), max(start_y, end_y)
         
-        # Convert thumbnail coordinates to PDF page coordinates
-        widget = self.current_crop['widget']
-        thumb_label = widget['thumb_label']
-        
-        # Get thumbnail dimensions
-        thumb_width = thumb_label.winfo_width()
-        thumb_height = thumb_label.winfo_height()
+        # Convert thumbnail coordinates to PDF page coordinates (dimensions measured in start_crop)
+        thumb_width = self.current_crop['thumb_width']
+        thumb_height = self.current_crop['thumb_height']
         
         if thumb_width <= 1 or thumb_height <= 1:
             self.current_crop = None
@@ -3243,26 +4448,38 @@ For issues or questions, please refer to the documentation or contact support.""
             
         # Get actual page dimensions
         page_index = page_num - 1
-        if page_index >= len(self.pdf_document):
+        page_rect = self.current_crop['page_rect']
+        if page_rect is None:
             self.current_crop = None
             return
-            
-        page = self.pdf_document[page_index]
-        page_rect = page.rect
+
+        # The placeholder does not have the page's proportions, so coordinates would be wrong
+        if self.page_thumbnails[page_index] is None:
+            self.current_crop = None
+            self.status_var.set("Page preview is still rendering - try again in a moment")
+            return
         
         # Convert coordinates
-        pdf_x1 = (x1 / thumb_width) * page_rect.width
-        pdf_y1 = (y1 / thumb_height) * page_rect.height
-        pdf_x2 = (x2 / thumb_width) * page_rect.width
-        pdf_y2 = (y2 / thumb_height) * page_rect.height
+        scale_x = page_rect.width / thumb_width
+        scale_y = page_rect.height / thumb_height
+        pdf_x1 = x1 * scale_x
+        pdf_y1 = y1 * scale_y
+        pdf_x2 = x2 * scale_x
+        pdf_y2 = y2 * scale_y
+        
+        # A drag that ends outside the thumbnail reaches past the page - keep only the
+        # part on the page, and drop crops with (almost) nothing left to render
+        crop_rect = fitz.Rect(pdf_x1, pdf_y1, pdf_x2, pdf_y2) & page_rect
+        if crop_rect.is_empty or crop_rect.get_area() < self.MIN_CROP_AREA:
+            self.current_crop = None
+            self.status_var.set("Crop is outside the page or too small")
+            return
+        pdf_x1, pdf_y1, pdf_x2, pdf_y2 = crop_rect
         
         # Generate unique crop ID
         self.crop_counter += 1
         crop_id = f"crop_{self.crop_counter}"
         
-        # Generate crop thumbnail image
-        crop_thumbnail = self.generate_crop_thumbnail(page_num, pdf_x1, pdf_y1, pdf_x2, pdf_y2)
-        
         # Store crop rectangle
         if page_num not in self.crop_rectangles:
             self.crop_rectangles[page_num] = []
@@ -3273,21 +4490,18 @@ For issues or questions, please refer to the documentation or contact support.""
             'thumb_coords': (x1, y1, x2, y2),
             'pdf_path': self.pdf_path,
             'page_num': page_num,
-            'thumbnail': crop_thumbnail
+            'thumbnail': None  # Filled in by finish_crop_thumbnail()
         }
         
         self.crop_rectangles[page_num].append(crop_data)
+        self._total_crops += 1
         
-        # Store thumbnail for display
-        if crop_thumbnail:
-            self.crop_thumbnails[crop_id] = crop_thumbnail
-        
-        # Update display
+        # Update display (the preview shows once it has rendered)
         self.update_crop_display()
+        self.request_crop_thumbnail(crop_data)
         
         # Update status
-        crop_count = sum(len(crops) for crops in self.crop_rectangles.values())
-        self.status_var.set(f"Crop added to page {page_num}. Total crops: {crop_count}")
+        self.status_var.set(f"Crop added to page {page_num}. Total crops: {self._total_crops}")
         
         # Clear current crop
         self.current_crop = None
@@ -3327,29 +4541,71 @@ For issues or questions, please refer to the documentation or contact support.""
             except:
                 # Fallback styling
                 thumb_frame.config(relief=tk.RAISED, borderwidth=2, bg='SystemButtonFace', highlightbackground='')
+                widget['bg'] = None  # Frame colour no longer matches set_page_color()
+                widget['border'] = None
 
-    def generate_crop_thumbnail(self, page_num, pdf_x1, pdf_y1, pdf_x2, pdf_y2):
-        """Generate a thumbnail image of the cropped area"""
+    def request_crop_thumbnail(self, crop_data):
+        """Render a crop's preview in the render pool, keeping the mouse release responsive"""
+        page_index = crop_data['page_num'] - 1
+        img = self.thumbnail_cache.get_crop(self.pdf_document.name, len(self.pdf_document),
+                                            page_index, crop_data['pdf_coords'])
+        if img is not None:
+            self.show_crop_thumbnail(crop_data, ImageTk.PhotoImage(img))
+            return
         try:
-            page_index = page_num - 1
-            if page_index >= len(self.pdf_document):
-                return None
-                
-            page = self.pdf_document[page_index]
-            
-            # Create crop rectangle
-            crop_rect = fitz.Rect(pdf_x1, pdf_y1, pdf_x2, pdf_y2)
-            
-            # Render the cropped area at moderate resolution for thumbnail
-            mat = fitz.Matrix(1.5, 1.5)  # 1.5x zoom for decent quality
-            pix = page.get_pixmap(matrix=mat, clip=crop_rect)
-            
-            # Convert to PIL Image
-            img_data = pix.tobytes("ppm")
-            img = Image.open(io.BytesIO(img_data))
+            future = self.get_render_pool().submit(_render_crop, self.pdf_document.name,
+                                                   page_index, crop_data['pdf_coords'])
+        except Exception as e:
+            print(f"Warning: Render pool unavailable, rendering crop in-process: {e}")
+            self.shutdown_render_pool()
+            self.finish_crop_thumbnail(crop_data, None)
+            return
+        future.add_done_callback(lambda f: self.root.after(0, self.finish_crop_thumbnail, crop_data, f))
+
+    def finish_crop_thumbnail(self, crop_data, future):
+        """Show a rendered crop preview (Tk thread), rendering in-process if the worker failed"""
+        # The crop may have been deleted or belong to a PDF that is no longer shown
+        page_crops = self.crop_rectangles.get(crop_data['page_num'], ())
+        if crop_data['id'] in self.crop_thumbnails or not any(crop is crop_data for crop in page_crops):
+            return
+        
+        photo = None
+        if future is not None:
+            try:
+                ppm_data = future.result()
+                photo = tk.PhotoImage(data=ppm_data)
+            except Exception as e:
+                print(f"Warning: Render worker failed for crop preview: {e}")
+            else:
+                # The cache is per source file - only store it while that file is still open
+                if crop_data['pdf_path'] == self.pdf_path:
+                    self.thumbnail_cache.put_crop(self.pdf_document.name, len(self.pdf_document),
+                                                  crop_data['page_num'] - 1, crop_data['pdf_coords'],
+                                                  Image.open(io.BytesIO(ppm_data)))
+        if photo is None and crop_data['pdf_path'] == self.pdf_path:
+            page = self.pdf_document[crop_data['page_num'] - 1]
+            photo = self.generate_crop_thumbnail(page, fitz.Rect(crop_data['pdf_coords']))
+        if photo is not None:
+            self.show_crop_thumbnail(crop_data, photo)
+
+    def show_crop_thumbnail(self, crop_data, photo):
+        """Attach a crop's rendered preview and show it in the preview panel"""
+        crop_data['thumbnail'] = photo
+        self.crop_thumbnails[crop_data['id']] = photo
+        if crop_data['pdf_path'] == self.pdf_path:
+            self.update_crop_display()
+
+    def generate_crop_thumbnail(self, page, crop_rect):
+        """Generate a thumbnail image of the cropped area of an already loaded page"""
+        try:
+            # Render only the cropped area, straight at thumbnail size (max 120x120,
+            # at most 1.5x zoom) so no downscaling pass is needed afterwards
+            zoom = _crop_zoom(crop_rect)
+            mat = fitz.Matrix(zoom, zoom)
+            pix = page.get_pixmap(matrix=mat, clip=crop_rect, alpha=False)
             
-            # Resize to thumbnail size (max 120x120 while preserving aspect ratio)
-            img.thumbnail((120, 120), Image.Resampling.LANCZOS)
+            # Wrap MuPDF's RGB buffer without copying - PhotoImage copies it while pix is alive
+            img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", 0, 1)
             
             # Convert to PhotoImage
             photo = ImageTk.PhotoImage(img)
@@ -3362,96 +4618,131 @@ For issues or questions, please refer to the documentation or contact support.""
         
     def get_page_widget(self, page_num):
         """Get widget for a specific page number"""
-        # Find widget with matching page number
-        for widget in self.page_widgets:
-            if widget is not None and widget['page_num'] == page_num:
-                return widget
-        return None
+        return self.page_widgets_by_num.get(page_num)
         
     def update_crop_display(self):
-        """Update visual display of crop thumbnails in the preview panel"""
-        # Clear existing crop thumbnails
-        for widget in self.crop_thumbnails_frame.winfo_children():
-            widget.destroy()
+        """Update visual display of crop thumbnails in the preview panel
+
+        Crops are drawn as a few canvas items each (tagged with the crop ID) rather than
+        a tree of widgets. Only the rows inside the visible part of the canvas are drawn
+        (see draw_visible_crop_rows); this lays out every row and sets the scroll region.
+        """
+        canvas = self.crop_canvas
+        canvas.delete(self.CROP_ROW_TAG)
+        self._crop_row_layout = []
+        self._crop_row_bounds = ([], [])
+        self._drawn_crop_rows = None
+        width = canvas.winfo_width()
         
         # Count total crops
-        total_crops = sum(len(crops) for crops in self.crop_rectangles.values())
-        self.crop_count_var.set(f"{total_crops} crops")
+        self.crop_count_var.set(f"{self._total_crops} crops")
         
-        if total_crops == 0:
+        if self._total_crops == 0:
             # Show "no crops" message
-            no_crops_label = tk.Label(self.crop_thumbnails_frame, 
-                                    text="No crops selected\n\nEnable crop mode and drag on\npage thumbnails to create crops",
-                                    font=(self.FONT_FAMILY, 10),
-                                    fg='gray',
-                                    bg='white',
-                                    justify=tk.CENTER)
-            no_crops_label.pack(expand=True, fill=tk.BOTH, pady=20)
-            self.crop_canvas.configure(scrollregion=self.crop_canvas.bbox("all"))
-            return
-            
-        # Display crop thumbnails
-        row = 0
+            canvas.create_text(width // 2, 20, anchor=tk.N,
+                               text="No crops selected\n\nEnable crop mode and drag on\npage thumbnails to create crops",
+                               font=(self.FONT_FAMILY, 10),
+                               fill='gray',
+                               justify=tk.CENTER,
+                               tags=(self.CROP_ROW_TAG,))
+            canvas.configure(scrollregion=canvas.bbox("all"))
+            return
+            
+        # Lay out crop thumbnails
+        top = 2
         for page_num, crops in self.crop_rectangles.items():
             # Only show crops for current PDF
-            for crop_data in crops:
+            for index, crop_data in enumerate(crops):
                 if crop_data.get('pdf_path') != self.pdf_path:
                     continue
-                    
-                # Create frame for this crop
-                crop_frame = tk.Frame(self.crop_thumbnails_frame, relief=tk.RAISED, 
-                                    borderwidth=1, bg='white', padx=5, pady=5)
-                crop_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), padx=5, pady=2)
-                
-                # Configure grid weight
-                self.crop_thumbnails_frame.columnconfigure(0, weight=1)
-                
-                # Crop info frame
-                info_frame = tk.Frame(crop_frame, bg='white')
-                info_frame.pack(fill=tk.X, pady=(0, 5))
-                
-                # Crop label
-                crop_label = tk.Label(info_frame, 
-                                    text=f"Page {page_num} - Crop {crops.index(crop_data) + 1}",
-                                    font=(self.FONT_FAMILY, 9, 'bold'),
-                                    bg='white')
-                crop_label.pack(side=tk.LEFT)
-                
-                # Delete button
-                delete_btn = tk.Button(info_frame, text="❌", 
-                                     font=(self.FONT_FAMILY, 8),
-                                     fg='red',
-                                     bg='white',
-                                     relief=tk.FLAT,
-                                     cursor='hand2',
-                                     command=lambda cid=crop_data['id']: self.delete_crop(cid))
-                delete_btn.pack(side=tk.RIGHT, padx=(5, 0))
-                
-                # Thumbnail image
-                if crop_data['thumbnail']:
-                    thumb_label = tk.Label(crop_frame, 
-                                         image=crop_data['thumbnail'], 
-                                         bg='white',
-                                         relief=tk.SOLID,
-                                         borderwidth=1)
-                    thumb_label.pack(pady=(0, 5))
-                else:
-                    # Fallback if thumbnail generation failed
-                    placeholder_label = tk.Label(crop_frame,
-                                                text="[Crop Preview]",
-                                                font=(self.FONT_FAMILY, 8),
-                                                fg='gray',
-                                                bg='lightgray',
-                                                width=15, height=8,
-                                                relief=tk.SOLID,
-                                                borderwidth=1)
-                    placeholder_label.pack(pady=(0, 5))
-                
-                row += 1
-        
-        # Update scroll region
-        self.crop_thumbnails_frame.update_idletasks()
-        self.crop_canvas.configure(scrollregion=self.crop_canvas.bbox("all"))
+                bottom = top + self.crop_row_height(crop_data)
+                self._crop_row_layout.append((top, bottom, crop_data, f"Page {page_num} - Crop {index + 1}"))
+                top = bottom + 4
+        
+        self._crop_row_bounds = ([row[0] for row in self._crop_row_layout],
+                                 [row[1] for row in self._crop_row_layout])
+        
+        # Update scroll region, then draw the rows in view
+        canvas.configure(scrollregion=(0, 0, width, top))
+        self.draw_visible_crop_rows()
+        
+    def draw_visible_crop_rows(self):
+        """Draw the crop rows that overlap the visible part of the crop canvas"""
+        canvas = self.crop_canvas
+        view_top = canvas.canvasy(0)
+        view_bottom = view_top + canvas.winfo_height()
+        
+        tops, bottoms = self._crop_row_bounds
+        first = bisect.bisect_left(bottoms, view_top)
+        last = bisect.bisect_right(tops, view_bottom)
+        if (first, last) == self._drawn_crop_rows:
+            return
+        self._drawn_crop_rows = (first, last)
+        
+        canvas.delete(self.CROP_ROW_TAG)
+        width = canvas.winfo_width()
+        for top, _, crop_data, text in self._crop_row_layout[first:last]:
+            self.draw_crop_row(crop_data, text, top, width)
+        
+    def crop_row_height(self, crop_data):
+        """Height of a crop's preview row as drawn by draw_crop_row"""
+        thumbnail = crop_data['thumbnail']
+        return 44 + (thumbnail.height() if thumbnail else self.CROP_PLACEHOLDER_SIZE[1])
+        
+    def draw_crop_row(self, crop_data, text, top, width):
+        """Draw one crop's row (label, delete glyph and preview) from y=top; returns its bottom"""
+        canvas = self.crop_canvas
+        tags = (self.CROP_ROW_TAG, crop_data['id'])
+        left, right, center = 5, width - 5, width // 2
+        
+        # Row border - its height is known once the preview is placed
+        border = canvas.create_rectangle(left, top, right, top, outline='gray', fill='white', tags=tags)
+        
+        # Crop label
+        canvas.create_text(left + 8, top + 8, anchor=tk.NW, text=text,
+                           font=(self.FONT_FAMILY, 9, 'bold'), tags=tags)
+        
+        # Delete button - a clickable glyph (see bind_crop_row_events)
+        canvas.create_text(right - 8, top + 8, anchor=tk.NE, text="❌",
+                           font=(self.FONT_FAMILY, 8), fill='red',
+                           tags=tags + (self.CROP_DELETE_TAG,))
+        
+        # Thumbnail image, or a placeholder if thumbnail generation failed
+        thumbnail = crop_data['thumbnail']
+        if thumbnail:
+            preview_width, preview_height = thumbnail.width(), thumbnail.height()
+        else:
+            preview_width, preview_height = self.CROP_PLACEHOLDER_SIZE
+        preview_top = top + 34
+        preview_left = center - preview_width // 2
+        canvas.create_rectangle(preview_left - 1, preview_top - 1,
+                                preview_left + preview_width, preview_top + preview_height,
+                                outline='black', fill='' if thumbnail else 'lightgray', tags=tags)
+        if thumbnail:
+            canvas.create_image(preview_left, preview_top, anchor=tk.NW, image=thumbnail, tags=tags)
+        else:
+            canvas.create_text(center, preview_top + preview_height // 2, text="[Crop Preview]",
+                               font=(self.FONT_FAMILY, 8), fill='gray', tags=tags)
+        
+        bottom = preview_top + preview_height + 10
+        canvas.coords(border, left, top, right, bottom)
+        return bottom
+        
+    def bind_crop_row_events(self):
+        """Make the drawn delete glyphs of the crop rows clickable"""
+        canvas = self.crop_canvas
+        canvas.tag_bind(self.CROP_DELETE_TAG, self.EVENT_BUTTON_1, self.on_crop_delete_click)
+        canvas.tag_bind(self.CROP_DELETE_TAG, '<Enter>', lambda e: canvas.config(cursor='hand2'))
+        canvas.tag_bind(self.CROP_DELETE_TAG, '<Leave>', lambda e: canvas.config(cursor=''))
+        
+    def on_crop_delete_click(self, event):
+        """Delete the crop whose delete glyph was clicked"""
+        tags = self.crop_canvas.gettags(tk.CURRENT)
+        self.crop_canvas.config(cursor='')
+        for tag in tags:
+            if tag not in (self.CROP_ROW_TAG, self.CROP_DELETE_TAG, tk.CURRENT):
+                self.delete_crop(tag)
+                return
 
     def delete_crop(self, crop_id):
         """Delete a specific crop by ID"""
@@ -3461,6 +4752,7 @@ For issues or questions, please refer to the documentation or contact support.""
                 if crop_data['id'] == crop_id:
                     # Remove from crops list
                     del crops[i]
+                    self._total_crops -= 1
                     
                     # Remove from thumbnails
                     if crop_id in self.crop_thumbnails:
@@ -3474,8 +4766,7 @@ For issues or questions, please refer to the documentation or contact support.""
                     self.update_crop_display()
                     
                     # Update status
-                    total_crops = sum(len(c) for c in self.crop_rectangles.values())
-                    self.status_var.set(f"Crop deleted. Total crops: {total_crops}")
+                    self.status_var.set(f"Crop deleted. Total crops: {self._total_crops}")
                     
                     return
         
@@ -3485,9 +4776,9 @@ For issues or questions, please refer to the documentation or contact support.""
             messagebox.showinfo("Info", "No crops to clear.")
             return
             
-        crop_count = sum(len(crops) for crops in self.crop_rectangles.values())
-        if messagebox.askyesno("Clear Crops", f"Clear all {crop_count} crop rectangles?"):
+        if messagebox.askyesno("Clear Crops", f"Clear all {self._total_crops} crop rectangles?"):
             self.crop_rectangles.clear()
+            self._total_crops = 0
             self.crop_thumbnails.clear()
             self.crop_counter = 0
             self.update_crop_display()
@@ -3499,6 +4790,10 @@ For issues or questions, please refer to the documentation or contact support.""
             messagebox.showwarning("Warning", "No crop rectangles defined. Enter crop mode and select areas first.")
             return
             
+        if self._export_running:
+            messagebox.showinfo("Info", "Crops are already being extracted.")
+            return
+            
         # Get custom base name choice from user
         if self.pdf_path:
             default_base = Path(self.pdf_path).stem
@@ -3518,45 +4813,83 @@ For issues or questions, please refer to the documentation or contact support.""
         if not save_dir:
             return
             
-        try:
-            crop_count = 0
-            for page_num, crops in self.crop_rectangles.items():
-                page_index = page_num - 1
-                
-                for i, crop_data in enumerate(crops):
-                    # Get crop coordinates
-                    pdf_x1, pdf_y1, pdf_x2, pdf_y2 = crop_data['pdf_coords']
-                    
-                    # Open the source PDF
-                    doc = fitz.open(crop_data['pdf_path'])
-                    page = doc[page_index]
-                    
-                    # Create crop rectangle
-                    crop_rect = fitz.Rect(pdf_x1, pdf_y1, pdf_x2, pdf_y2)
-                    
-                    # Crop the page
-                    page.set_cropbox(crop_rect)
-                    
-                    # Create new PDF with cropped page
-                    new_doc = fitz.open()
-                    new_doc.insert_pdf(doc, from_page=page_index, to_page=page_index)
-                    
-                    # Generate filename using chosen base name
-                    filename = f"{chosen_base}_page_{page_num}_crop_{i+1}.pdf"
-                    save_path = os.path.join(save_dir, filename)
-                    
-                    # Save cropped PDF
-                    new_doc.save(save_path)
-                    new_doc.close()
-                    doc.close()
-                    
-                    crop_count += 1
-                    
-            messagebox.showinfo("Success", f"Extracted {crop_count} crop regions as PDF files to:\n{save_dir}")
-            self.status_var.set(f"Extracted {crop_count} crops as PDF files")
+        jobs = self.plan_crop_exports(chosen_base, save_dir, "pdf")
+        self.export_crops(jobs, _extract_crop_pdf, _save_crop_pdf, "PDF", save_dir)
             
+    def plan_crop_exports(self, chosen_base, save_dir, extension):
+        """List (source PDF, page index, crop coordinates, output path) for every crop
+
+        Jobs are grouped by source PDF, so each document is opened once in-process and
+        workers rarely have to swap documents in their cache.
+        """
+        jobs = [(crop_data['pdf_path'], page_num - 1, crop_data['pdf_coords'],
+                 os.path.join(save_dir, f"{chosen_base}_page_{page_num}_crop_{i+1}.{extension}"))
+                for page_num, crops in self.crop_rectangles.items()
+                for i, crop_data in enumerate(crops)]
+        jobs.sort(key=lambda job: job[0])
+        return jobs
+            
+    def export_crops(self, jobs, pool_worker, save_crop, file_type, save_dir):
+        """Write the planned crops in the render pool, waiting for them on a background thread
+
+        pool_worker takes a job's fields and runs in a worker process; save_crop takes
+        an open document instead of a path and is the in-process fallback.
+        """
+        try:
+            pool = self.get_render_pool()
+            futures = [pool.submit(pool_worker, *job) for job in jobs]
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to extract crops as PDF:\n{str(e)}")
+            print(f"Warning: Render pool unavailable, extracting crops in-process: {e}")
+            self.shutdown_render_pool()
+            self.finish_crop_export(file_type, save_dir, len(jobs), self.save_crops_in_process(jobs, save_crop))
+            return
+        
+        # One export at a time; finish_crop_export re-enables the buttons
+        self._export_running = True
+        self.update_buttons_for_background_tasks()
+        self.status_var.set(f"Extracting {len(jobs)} crops as {file_type} files...")
+        threading.Thread(target=self.run_crop_export_thread, args=(futures, file_type, save_dir),
+                         daemon=True).start()
+            
+    def run_crop_export_thread(self, futures, file_type, save_dir):
+        """Background thread body: wait for the crop workers, then report back on the Tk thread"""
+        error = None
+        for done, future in enumerate(futures, 1):
+            try:
+                future.result()
+            except Exception as e:
+                error = error or e
+            self.root.after(0, self.status_var.set, f"Extracting crops: {done}/{len(futures)}...")
+        self.root.after(0, self.finish_crop_export, file_type, save_dir, len(futures), error)
+            
+    def save_crops_in_process(self, jobs, save_crop):
+        """Write the planned crops on this thread; returns the first error or None"""
+        # Source documents opened once and shared by all crops taken from them
+        source_documents = {}
+        try:
+            for pdf_path, page_index, clip, save_path in jobs:
+                if pdf_path not in source_documents:
+                    source_documents[pdf_path] = fitz.open(pdf_path)
+                save_crop(source_documents[pdf_path], page_index, clip, save_path)
+        except Exception as e:
+            return e
+        finally:
+            for doc in source_documents.values():
+                doc.close()
+        return None
+            
+    def finish_crop_export(self, file_type, save_dir, crop_count, error):
+        """Report the end of a crop export (error is None on success)"""
+        self._export_running = False
+        if self._closing:
+            # request_close destroys the window now that the export has stopped
+            return
+        self.update_buttons_for_background_tasks()
+        if error is None:
+            messagebox.showinfo("Success", f"Extracted {crop_count} crop regions as {file_type} files to:\n{save_dir}")
+            self.status_var.set(f"Extracted {crop_count} crops as {file_type} files")
+        else:
+            messagebox.showerror("Error", f"Failed to extract crops as {file_type}:\n{str(error)}")
             
     def extract_crops_png(self):
         """Extract all crop rectangles as PNG files"""
@@ -3564,6 +4897,10 @@ For issues or questions, please refer to the documentation or contact support.""
             messagebox.showwarning("Warning", "No crop rectangles defined. Enter crop mode and select areas first.")
             return
             
+        if self._export_running:
+            messagebox.showinfo("Info", "Crops are already being extracted.")
+            return
+            
         # Get custom base name choice from user
         if self.pdf_path:
             default_base = Path(self.pdf_path).stem
@@ -3583,41 +4920,8 @@ For issues or questions, please refer to the documentation or contact support.""
         if not save_dir:
             return
             
-        try:
-            crop_count = 0
-            for page_num, crops in self.crop_rectangles.items():
-                page_index = page_num - 1
-                
-                for i, crop_data in enumerate(crops):
-                    # Get crop coordinates
-                    pdf_x1, pdf_y1, pdf_x2, pdf_y2 = crop_data['pdf_coords']
-                    
-                    # Open the source PDF
-                    doc = fitz.open(crop_data['pdf_path'])
-                    page = doc[page_index]
-                    
-                    # Create crop rectangle
-                    crop_rect = fitz.Rect(pdf_x1, pdf_y1, pdf_x2, pdf_y2)
-                    
-                    # Render the cropped area at high resolution
-                    mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better quality
-                    pix = page.get_pixmap(matrix=mat, clip=crop_rect)
-                    
-                    # Generate filename using chosen base name
-                    filename = f"{chosen_base}_page_{page_num}_crop_{i+1}.png"
-                    save_path = os.path.join(save_dir, filename)
-                    
-                    # Save as PNG
-                    pix.save(save_path)
-                    doc.close()
-                    
-                    crop_count += 1
-                    
-            messagebox.showinfo("Success", f"Extracted {crop_count} crop regions as PNG files to:\n{save_dir}")
-            self.status_var.set(f"Extracted {crop_count} crops as PNG files")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to extract crops as PNG:\n{str(e)}")
+        jobs = self.plan_crop_exports(chosen_base, save_dir, "png")
+        self.export_crops(jobs, _extract_crop_png, _save_crop_png, "PNG", save_dir)
 
     def merge_two_pdfs(self):
         """Merge two PDFs from the loaded PDF list"""
@@ -3704,8 +5008,8 @@ For issues or questions, please refer to the documentation or contact support.""
                 second_pdf = self.pdf_list[second_idx]
                 
                 try:
-                    first_doc = self.pdf_documents.get(first_pdf) or fitz.open(first_pdf)
-                    second_doc = self.pdf_documents.get(second_pdf) or fitz.open(second_pdf)
+                    first_doc = self.get_document(first_pdf)
+                    second_doc = self.get_document(second_pdf)
                     
                     preview_text.config(state=tk.NORMAL)
                     preview_text.delete(1.0, tk.END)
@@ -3827,8 +5131,6 @@ For issues or questions, please refer to the documentation or contact support.""
             
             # Store the first PDF name for default naming (use original path for naming)
             self.merged_first_pdf_name = Path(first_pdf_path).stem
-            print(f"DEBUG: Stored merged PDF name: '{self.merged_first_pdf_name}' from path: '{first_pdf_path}'")
-            print(f"DEBUG: Using actual paths - First: '{actual_first_path}', Second: '{actual_second_path}'")
             
             # Create temporary file for merged PDF
             import tempfile
@@ -3902,7 +5204,7 @@ For issues or questions, please refer to the documentation or contact support.""
             
             # Generate thumbnails
             self.status_var.set("Generating thumbnails for merged PDF...")
-            threading.Thread(target=self.generate_thumbnails, daemon=True).start()
+            self.generate_thumbnails()
             
             # Show success message
             messagebox.showinfo("Success", 
@@ -3916,13 +5218,21 @@ For issues or questions, please refer to the documentation or contact support.""
             
     def clear_all_state(self):
         """Clear all application state before loading new PDF"""
+        # Stop rendering pages of the previous document
+        self.cancel_pending_renders()
+
         # Clear thumbnails
         if hasattr(self, 'page_thumbnails'):
             self.page_thumbnails.clear()
+            self.live_thumbnails.clear()
         
         # Clear widgets
         if hasattr(self, 'page_widgets'):
             self.page_widgets.clear()
+            self.page_widgets_by_num.clear()
+            self.page_widget_of.clear()
+            self._grid_entries = []
+            self._widget_pool = []
             
         # Clear selections
         if hasattr(self, 'selected_ranges'):
@@ -3931,6 +5241,7 @@ For issues or questions, please refer to the documentation or contact support.""
         # Clear crops
         if hasattr(self, 'crop_rectangles'):
             self.crop_rectangles.clear()
+            self._total_crops = 0
             self.crop_thumbnails.clear()
             
         # Reset edit state
@@ -3975,10 +5286,8 @@ For issues or questions, please refer to the documentation or contact support.""
         # Get save location with smart default naming
         if self.merged_first_pdf_name:
             default_name = f"{self.merged_first_pdf_name}_merged.pdf"
-            print(f"DEBUG: Using merged name '{self.merged_first_pdf_name}' -> default: '{default_name}'")
         else:
             default_name = "merged_document.pdf"
-            print(f"DEBUG: No merged name stored, using fallback: '{default_name}'")
             
         save_path = filedialog.asksaveasfilename(
             title="Save Merged PDF",
@@ -3993,34 +5302,13 @@ For issues or questions, please refer to the documentation or contact support.""
         try:
             self.status_var.set("Saving merged PDF...")
             
-            # Create final PDF with all edits applied
-            merged_writer = PyPDF2.PdfWriter()
-            merged_reader = PyPDF2.PdfReader(self.merged_temp_path)
-            
-            # Apply page order, deletions, and rotations
-            for page_index in self.page_order:
-                if page_index in self.deleted_pages:
-                    continue
-                    
-                if page_index < len(merged_reader.pages):
-                    page = merged_reader.pages[page_index]
-                    
-                    # Apply rotation if set for this page (1-based)
-                    page_number_1based = page_index + 1
-                    if page_number_1based in self.page_rotations:
-                        rotation_angle = self.page_rotations[page_number_1based]
-                        if rotation_angle == 90:
-                            page = page.rotate(90)
-                        elif rotation_angle == 180:
-                            page = page.rotate(180)
-                        elif rotation_angle == 270:
-                            page = page.rotate(270)
-                    
-                    merged_writer.add_page(page)
+            # Create final PDF with all edits applied, straight from the open merged document
+            pdf_data = self.edited_pdf_bytes()
+            page_count = len(self.kept_page_indices())
             
             # Write final PDF
             with open(save_path, 'wb') as output_file:
-                merged_writer.write(output_file)
+                output_file.write(pdf_data)
             
             # Show success message
             details = []
@@ -4036,7 +5324,7 @@ For issues or questions, please refer to the documentation or contact support.""
             messagebox.showinfo("Success", 
                               f"Merged PDF saved successfully!\n\n"
                               f"File: {os.path.basename(save_path)}\n"
-                              f"Pages: {len(merged_writer.pages)}{detail_text}")
+                              f"Pages: {page_count}{detail_text}")
                               
             self.status_var.set(f"Merged PDF saved: {os.path.basename(save_path)}")
             
@@ -4046,6 +5334,9 @@ For issues or questions, please refer to the documentation or contact support.""
 
 def main():
     """Main application entry point"""
+    # Required for the render process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
     root = tk.Tk()
     
     # Set window icon if available (you can add an icon file)
@@ -4060,11 +5351,8 @@ def main():
     
     app = VisualPDFSplitterApp(root)
     
-    # Handle window closing - no confirmation needed
-    def on_closing():
-        root.destroy()
-    
-    root.protocol("WM_DELETE_WINDOW", on_closing)
+    # Handle window closing - confirmation is only asked while a split is being written
+    root.protocol("WM_DELETE_WINDOW", app.request_close)
     
     try:
         root.mainloop()